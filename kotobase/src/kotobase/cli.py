@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -116,17 +117,29 @@ def _path_size(path: Path) -> int:
     """
     Compute the total size in bytes of a file or directory tree
 
+    Directory trees are walked with `os.scandir`, whose entries already know
+    their type, so each file costs a single `stat` call
+
     Args:
         path (Path): The file or directory to measure
 
     Returns:
         The total size in bytes, or 0 when the path does not exist
     """
-    if path.is_dir():
-        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
     if path.is_file():
         return path.stat().st_size
-    return 0
+    if not path.is_dir():
+        return 0
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
 
 
 def _kanji_find_title(
@@ -689,11 +702,23 @@ def db_build(
             ),
         ),
     ] = True,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "-w",
+            "--workers",
+            min=1,
+            help=(
+                "Number Of Processes Loading Sources In Parallel, Defaults To "
+                "One Per CPU"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """
     Download Upstream Sources And Build The Database Locally
     """
-    builder.build_core(force=force, include_links=with_links)
+    builder.build_core(force=force, include_links=with_links, workers=workers)
     if with_audio:
         builder.build_audio(force=force)
 
@@ -10,7 +10,8 @@ abstract: Contents
       with the database
 
     - The [`Unit Of Work`][kotobase.db.uow] and [`Repos`][kotobase.db.repos]
-      that abstract raw database queries
+      that abstract raw database queries, backed by a shared
+      [`LFU Cache`][kotobase.db.cache] for hot lookups
 
     - The [`Data-Transfer-Object`][kotobase.db.dtos] dataclasses that
       aggregate the information stored in the database and isolate its internal
@@ -20,7 +21,7 @@ abstract: Contents
       from upstream sources
 """
 
-from . import builder, connection, dtos, models, repos, uow
+from . import builder, cache, connection, dtos, models, repos, uow
 from .connection import session_scope
 from .models import Base
 from .uow import UnitOfWork
@@ -29,6 +30,7 @@ __all__ = [
     "Base",
     "UnitOfWork",
     "builder",
+    "cache",
     "connection",
     "dtos",
     "models",
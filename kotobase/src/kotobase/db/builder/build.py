@@ -17,23 +17,36 @@ abstract: `Builder` and `Loader`
 
 info: The Recipe
     - [`build_core`][kotobase.db.builder.build.build_core] Runs
-      `Download` -> `Create Schema` -> `Load` -> `Build Index` ->
-      `Write Metadata` -> `Optimize`
+      `Download` -> `Create Schema` -> `Stage` -> `Merge` ->
+      `Build Indexes` -> `Build FTS Index` -> `Write Metadata` -> `Optimize`
 
-    - The read model schema is created from the `SQLAlchemy` metadata, while
-      the bulk load runs on a raw `sqlite3` connection for speed
+    - Each extractor is loaded into its own staging database in a worker
+      process, so the sources parse and insert concurrently, then every stage
+      is `ATTACH`ed to the target and copied over with a single
+      `INSERT INTO ... SELECT` per table
+
+    - The read model schema is defined by the `SQLAlchemy` metadata, but its
+      `DDL` is compiled once and executed on the same raw `sqlite3` connection
+      as the bulk load, so the build never opens an engine or a session
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import multiprocessing
 import sqlite3
+import tempfile
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import zstandard
-from sqlalchemy import create_engine
+from sqlalchemy import Table
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable, ExecutableDDLElement
 
 from ...exceptions import DatabaseExistsError
 from ...terminal_output import (
@@ -46,10 +59,13 @@ from . import config
 from .download import download_all
 from .extractors import EXTRACTORS
 
-_BATCH = 5000
+_BATCH = 20_000
 """
 Number of rows buffered per table before they are flushed
 (inserted into the database) with a single `executemany` call
+
+Large enough that the per-call overhead is amortized over many rows, small
+enough that the buffered tuples of every table stay a few megabytes
 """
 
 CORE_SOURCES = (
@@ -89,6 +105,10 @@ class Loader:
         - The insert statement for a table is derived from the keys of its
           first row, so every row for a table must carry the same keys
 
+        - Each row dict is turned into the positional tuple `executemany`
+          binds with a cached `operator.itemgetter`, so the per-row
+          conversion runs in C rather than in a Python generator
+
     Attributes:
         conn (sqlite3.Connection): The open database connection
         batch (int): Number of rows to buffer before a flush
@@ -106,6 +126,9 @@ class Loader:
             insert statement for subsequent rows of that same `table`
         _statements (dict[str, str]): Mapping of table names to their
             `INSERT` SQL satement derived from `rows` and `_OR_IGNORE`
+        _getters (dict[str, Callable[[dict[str, Any]], tuple[Any, ...]]]):
+            Mapping of table names to the callable that extracts a row's
+            values in `_columns` order as a tuple
     """
 
     _OR_IGNORE = frozenset(
@@ -137,6 +160,9 @@ class Loader:
         self._buffers: dict[str, list[tuple[Any, ...]]] = {}
         self._columns: dict[str, list[str]] = {}
         self._statements: dict[str, str] = {}
+        self._getters: dict[
+            str, Callable[[dict[str, Any]], tuple[Any, ...]]
+        ] = {}
 
     def add(self, table: str, row: dict[str, Any]) -> None:
         """
@@ -163,17 +189,41 @@ class Loader:
                 f"{verb} {table} ({', '.join(columns)}) "
                 f"VALUES ({placeholders})"
             )
+            self._getters[table] = self._row_getter(columns)
             # Create The Table's Buffer
             self._buffers[table] = []
 
         # Add New Row
-        self._buffers[table].append(
-            tuple(row[column] for column in self._columns[table])
-        )
+        self._buffers[table].append(self._getters[table](row))
         # Insert Filled Buffer
         if len(self._buffers[table]) >= self.batch:
             self._flush(table)
 
+    @staticmethod
+    def _row_getter(
+        columns: list[str],
+    ) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+        """
+        Build the callable that turns a row dict into its positional tuple
+
+        `operator.itemgetter` returns a bare value rather than a tuple when
+        given a single key, so single column tables are wrapped to keep the
+        buffer shape uniform
+
+        Args:
+            columns (list[str]): The table's column names in insert order
+
+        Returns:
+            A callable mapping a row dict to a tuple of its values
+        """
+        if len(columns) == 1:
+            (column,) = columns
+            return lambda row: (row[column],)
+        getter: Callable[[dict[str, Any]], tuple[Any, ...]] = itemgetter(
+            *columns
+        )
+        return getter
+
     def _flush(self, table: str) -> None:
         """
         Flush (insert into database) the buffered rows of a single table
@@ -221,6 +271,8 @@ class Builder:
         path (Path): The database file being written
         conn (sqlite3.Connection): The open connection used for the bulk load
         loader (Loader): The batched insert helper bound to the connection
+        _tables (list[Table]): The tables created by `create_schema`, whose
+            secondary indexes `build_indexes` creates after the load
     """
 
     _FTS_SCRIPT = """
@@ -236,8 +288,12 @@ class Builder:
 
         - Headword lookups hit the indexed form tables directly
 
-        - Japanese sentence search uses `LIKE` with an early `LIMIT`, so
-          dedicated headword and sentence indexes would only add size
+        - Japanese sentence search, wildcard or not, is a single `LIKE`
+          scan with an early `LIMIT`. The `unicode61` tokenizer cannot split
+          unspaced Japanese, and a `trigram` index only serves literals of
+          three or more characters, while most sentence lookups are one or
+          two kanji, so it would multiply the sentence text's size for
+          little gain
     """
 
     def __init__(self, path: Path) -> None:
@@ -245,13 +301,13 @@ class Builder:
         Open a connection to the target database and prepare it for loading
 
         Args:
-            path (Path): The database file to write, with its schema already
-                created
+            path (Path): The database file to write
         """
         self.path = path
         self.conn = sqlite3.connect(path)
         self._apply_build_pragmas()
         self.loader = Loader(self.conn)
+        self._tables: list[Table] = []
 
     def __enter__(self) -> Builder:
         """
@@ -295,12 +351,67 @@ class Builder:
 
             - `mmap_size=268435456` &rarr; Memory map 256 MB of the file to cut
               read syscalls during the load
+
+            - `locking_mode=EXCLUSIVE` &rarr; Take the file lock once and keep
+              it until the connection closes, instead of acquiring and
+              releasing it around every transaction. Nothing else reads the
+              database while it is being built
         """
         self.conn.execute("PRAGMA journal_mode=OFF")
         self.conn.execute("PRAGMA synchronous=OFF")
         self.conn.execute("PRAGMA temp_store=MEMORY")
         self.conn.execute("PRAGMA cache_size=-200000")
         self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+    def create_schema(
+        self,
+        *,
+        only: set[str] | None = None,
+        exclude: set[str] | None = None,
+    ) -> None:
+        """
+        Create the read model tables on the builder's connection
+
+        Only the tables, with their primary keys and unique constraints, are
+        created here. Secondary indexes are left to `build_indexes` so the
+        bulk load does not update every index b-tree row by row
+
+        Args:
+            only (set[str] | None): When given, only these tables are created
+            exclude (set[str] | None): Tables to skip, such as the audio table
+                for a core build
+        """
+        self._tables = _schema_tables(only=only, exclude=exclude)
+        for table in self._tables:
+            self.conn.execute(_compile(CreateTable(table)))
+        self.conn.commit()
+
+    def build_indexes(self) -> None:
+        """
+        Create the secondary indexes of every table made by `create_schema`
+
+        Run after the bulk load, so each index is built from one sorted pass
+        over a fully loaded table instead of one random b-tree insert per row
+
+        info: PRAGMAs
+            - Every index build scans its whole table, so for its duration
+              the memory map is widened to `SQLite`'s default 2 GB ceiling,
+              which covers the entire database, and the page cache is raised
+              to about 500 MB
+
+            - Both are restored to the load values of `_apply_build_pragmas`
+              afterwards
+        """
+        self.conn.execute("PRAGMA mmap_size=2147418112")
+        self.conn.execute("PRAGMA cache_size=-500000")
+        for table in self._tables:
+            # `Table.indexes` is a set, so sort by name for a stable order
+            for index in sorted(table.indexes, key=lambda ix: str(ix.name)):
+                self.conn.execute(_compile(CreateIndex(index)))
+        self.conn.commit()
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-200000")
 
     def run(self, name: str, *args: Any) -> None:
         """
@@ -329,6 +440,35 @@ class Builder:
         self.loader.flush_all()
         self.conn.commit()
 
+    def merge(self, stage: Path, counts: dict[str, int]) -> None:
+        """
+        Copy every loaded table of a staging database into this database
+
+        The stage is attached and each table is copied with one
+        `INSERT INTO ... SELECT`, which `SQLite` runs as a sequential scan
+        entirely in C. Tables in `Loader._OR_IGNORE`, such as `tag` which both
+        `JMDict` and `JMnedict` fill, keep their dedupe on the copy
+
+        Args:
+            stage (Path): A staging database written by
+                [`_stage`][kotobase.db.builder.build._stage]
+            counts (dict[str, int]): Mapping of the stage's table names to the
+                number of rows loaded into them, added to the loader's counts
+        """
+        self.conn.execute("ATTACH DATABASE ? AS stage", (str(stage),))
+        for table, rows in counts.items():
+            verb = (
+                "INSERT OR IGNORE INTO"
+                if table in Loader._OR_IGNORE
+                else "INSERT INTO"
+            )
+            self.conn.execute(
+                f"{verb} main.{table} SELECT * FROM stage.{table}"
+            )
+            self.loader.counts[table] = self.loader.counts.get(table, 0) + rows
+        self.conn.commit()
+        self.conn.execute("DETACH DATABASE stage")
+
     def report_counts(self) -> None:
         """
         Print the number of rows inserted into each table
@@ -358,10 +498,10 @@ class Builder:
             "size_mb": f"{size_mb:.1f}",
         }
         for key, path in paths.items():
-            meta[f"source.{key}"] = Path(path).name
+            meta[f"source.{key}"] = path.name
         self.conn.executemany(
             "INSERT OR REPLACE INTO db_meta(key, value) VALUES (?, ?)",
-            list(meta.items()),
+            meta.items(),
         )
         self.conn.commit()
 
@@ -380,42 +520,140 @@ class Builder:
         self.conn.execute("VACUUM")
 
 
-def _create_schema(
-    path: Path,
+def _schema_tables(
     *,
     only: set[str] | None = None,
     exclude: set[str] | None = None,
-) -> None:
+) -> list[Table]:
     """
-    Create the read model schema on an empty database file
-
-    The schema is defined once in the SQLAlchemy metadata, so it is created
-    through a temporary engine that is disposed immediately, leaving the bulk
-    load to run on a raw sqlite3 connection
+    Select read model tables from the SQLAlchemy metadata
 
     Args:
-        path (Path): The database file to create the schema in
-        only (set[str] | None): When given, only these tables are created
+        only (set[str] | None): When given, only these tables are selected
         exclude (set[str] | None): Tables to skip, such as the audio table for
             a core build
+
+    Returns:
+        The selected tables in dependency order
     """
     only_set = only or set()
     exclude_set = exclude or set()
-    tables = [
+    return [
         table
         for table in Base.metadata.sorted_tables
         if (not only_set or table.name in only_set)
         and table.name not in exclude_set
     ]
-    engine = create_engine(f"sqlite:///{path}")
-    Base.metadata.create_all(engine, tables=tables)
-    engine.dispose()
+
+
+def _compile(ddl: ExecutableDDLElement) -> str:
+    """
+    Render a `DDL` construct to plain `SQL` for the `SQLite` dialect
+
+    The schema is defined once in the SQLAlchemy metadata, but it is rendered
+    here so it can run on the builder's raw `sqlite3` connection, without a
+    throwaway engine, pool or session
+
+    Args:
+        ddl (ExecutableDDLElement): A `CreateTable` or `CreateIndex` construct
+
+    Returns:
+        The compiled statement
+    """
+    return str(ddl.compile(dialect=sqlite.dialect()))
+
+
+def _stage(path: Path, name: str, *args: Any) -> dict[str, int]:
+    """
+    Load one extractor into its own staging database
+
+    Runs in a worker process, so it only takes picklable arguments and
+    returns the loader's row counts for the parent to report
+
+    Args:
+        path (Path): The staging database file to create
+        name (str): Registry key of the extractor to run
+        *args (Any): Positional arguments forwarded to the extractor
+
+    Returns:
+        Mapping of table names to the number of rows loaded into them
+    """
+    with Builder(path) as stage:
+        stage.create_schema(only=set(EXTRACTORS[name].tables))
+        stage.run(name, *args)
+        stage.finish_load()
+        return stage.loader.counts
+
+
+def _load(
+    builder: Builder,
+    plan: list[tuple[str, tuple[Any, ...]]],
+    *,
+    workers: int | None = None,
+) -> None:
+    """
+    Load every extractor of a build plan into the builder's database
+
+    info: Load Modes
+        - `workers=1` &rarr; Each extractor is streamed straight into the
+          builder's own loader, one after another, with no worker processes
+          or staging files
+
+        - Otherwise &rarr; Each extractor is loaded into its own staging
+          database by a pool of spawned worker processes, and the stages are
+          merged into the target as they finish
+
+    Args:
+        builder (Builder): The builder of the target database, with its
+            schema already created
+        plan (list[tuple[str, tuple[Any, ...]]]): Pairs of extractor names
+            and the arguments that extractor declares
+        workers (int | None): Number of worker processes, or None for one per
+            CPU
+    """
+    with build_status("[heading]Loading Data[/]") as status:
+        if workers == 1:
+            for name, source_args in plan:
+                status.update(f"[heading]Loading Data[/] [muted]({name})[/]")
+                builder.run(name, *source_args)
+            status.update("[info]Finalizing[/]")
+            builder.finish_load()
+            return
+
+        with (
+            tempfile.TemporaryDirectory(
+                prefix="stage-", dir=builder.path.parent
+            ) as staging,
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool,
+        ):
+            stages: list[tuple[str, Path, Future[dict[str, int]]]] = []
+            for name, source_args in plan:
+                stage = Path(staging) / f"{name}.db"
+                stages.append(
+                    (
+                        name,
+                        stage,
+                        pool.submit(_stage, stage, name, *source_args),
+                    )
+                )
+            # Merge in plan order so `OR IGNORE` tables keep the first
+            # source's rows, exactly as a sequential load would
+            for name, stage, future in stages:
+                status.update(f"[heading]Loading Data[/] [muted]({name})[/]")
+                counts = future.result()
+                status.update(f"[heading]Merging[/] [muted]({name})[/]")
+                builder.merge(stage, counts)
+                stage.unlink()
 
 
 def build_core(
     *,
     force: bool = False,
     include_links: bool = True,
+    workers: int | None = None,
 ) -> Path:
     """
     Build the kotobase core database from its sources
@@ -424,6 +662,9 @@ def build_core(
         force (bool): When True, rebuild even if a database already exists
         include_links (bool): When True, download and align the Tatoeba links
             and English sentences, which is the heaviest part of the build
+        workers (int | None): Number of worker processes that load the
+            sources in parallel, None for one per CPU, or 1 to load them one
+            after another in this process
 
     Returns:
         The path of the compiled database
@@ -444,10 +685,7 @@ def build_core(
 
     with build_status("[heading]Downloading Sources[/]"):
         paths = download_all(keys)
-    with build_status("[heading]Creating Schema[/]"):
-        target.unlink(missing_ok=True)
-        # Audio lives in the separate pack, not the core database
-        _create_schema(target, exclude={"audio"})
+    target.unlink(missing_ok=True)
 
     # Tatoeba alignment is optional, so its link and English sources are passed
     # only when they were downloaded. Each plan entry pairs an extractor name
@@ -467,14 +705,14 @@ def build_core(
 
     started = time.perf_counter()
     with Builder(target) as builder:
-        with build_status("[heading]Loading Data[/]") as status:
-            for name, source_args in plan:
-                status.update(f"[heading]Loading Data[/] [muted]({name})[/]")
-                builder.run(name, *source_args)
-            status.update("[info]Finalizing[/]")
-            builder.finish_load()
+        with build_status("[heading]Creating Schema[/]"):
+            # Audio lives in the separate pack, not the core database
+            builder.create_schema(exclude={"audio"})
+        _load(builder, plan, workers=workers)
         builder.report_counts()
 
+        with build_status("[heading]Building Indexes[/]"):
+            builder.build_indexes()
         with build_status("[heading]Building Search Index[/]"):
             builder.build_fts()
         builder.write_meta(paths, time.perf_counter() - started)
@@ -520,14 +758,14 @@ def build_audio(*, force: bool = False) -> Path:
     THEMED_CONSOLE.print("[heading]Downloading Sources[/]")
     paths = download_all(list(AUDIO_SOURCES))
 
-    with build_status("[heading]Creating Schema[/]"):
-        pack.unlink(missing_ok=True)
-        _create_schema(pack, only={"audio"})
-
+    pack.unlink(missing_ok=True)
     with Builder(pack) as builder:
+        with build_status("[heading]Creating Schema[/]"):
+            builder.create_schema(only={"audio"})
         with build_status("[heading]Building Audio Pack[/]"):
             builder.run("audio", paths["kanjialive"], paths["kanjialive_data"])
             builder.finish_load()
+            builder.build_indexes()
         builder.report_counts()
         with build_status("[heading]Optimizing[/]"):
             builder.optimize(analyze=False)
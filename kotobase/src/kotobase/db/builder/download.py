@@ -23,11 +23,14 @@ from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
 import requests
 import zstandard
+from rich.progress import Progress
 
 from ...exceptions import DatabaseExistsError, DownloadError
 from ...terminal_output import THEMED_CONSOLE, download_progress_bar
@@ -44,6 +47,26 @@ from .config import (
     raw_dir,
 )
 
+_CHUNK_SIZE = 1 << 20
+"""
+Number of bytes read from the network per iteration of a streamed download
+
+info: Why 1 MiB
+    Every chunk costs one file write and one progress bar update, so a large
+    chunk keeps that per iteration bookkeeping negligible on multi-hundred
+    megabyte sources while the bar still refreshes several times a second
+"""
+
+_DOWNLOAD_WORKERS = 4
+"""
+Number of upstream sources downloaded at the same time by
+[`download_all`][kotobase.db.builder.download.download_all]
+
+The sources live on a handful of different hosts, so a few concurrent
+transfers overlap their latency and bandwidth limits without hammering any
+single server
+"""
+
 
 def _session() -> requests.Session:
     """
@@ -229,6 +252,7 @@ def _download_stream(
     session: requests.Session,
     label: str,
     clear: bool = True,
+    progress: Progress | None = None,
 ) -> None:
     """
     Streams the download of a file URL to a destination file path with a
@@ -244,24 +268,31 @@ def _download_stream(
         label (str): Short label shown on the progress bar
         clear (bool): Whether to set `visible=False` on the `rich.Progress`
             task when download end
+        progress (Progress | None): A shared, already started progress bar
+            to add the download's task to, or None to display a new one
 
     Raises:
         DownloadError: If the download fails for any reason
     """
     part = dest.with_name(dest.name + ".part")
+    display = (
+        nullcontext(progress)
+        if progress is not None
+        else download_progress_bar()
+    )
     try:
         with session.get(url, stream=True, timeout=120) as response:
             response.raise_for_status()
             # Get File Size
             total = int(response.headers.get("content-length", 0)) or None
-            with download_progress_bar() as progress:
-                task = progress.add_task(label, total=total)
+            with display as bar:
+                task = bar.add_task(label, total=total)
                 with open(part, "wb") as handle:
-                    for chunk in response.iter_content(chunk_size=65536):
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                         handle.write(chunk)
-                        progress.update(task, advance=len(chunk))
+                        bar.update(task, advance=len(chunk))
                 if clear:
-                    progress.update(task, visible=False)
+                    bar.update(task, visible=False)
         part.replace(dest)
     except Exception as e:
         part.unlink(missing_ok=True)
@@ -275,6 +306,7 @@ def download(
     *,
     force: bool = False,
     session: requests.Session | None = None,
+    progress: Progress | None = None,
 ) -> Path:
     """
     Downloads a single upstream source into the per-user cache raw directory
@@ -284,6 +316,8 @@ def download(
         force (bool): When True, re download even if the file already exists
         session (requests.Session | None): Optional shared session, a new one
             is created when omitted
+        progress (Progress | None): Optional shared progress bar, a new one is
+            displayed when omitted
 
     Raises:
         DownloadError: If the download fails for any reason
@@ -305,6 +339,7 @@ def download(
         dest,
         session,
         f"Downloading {source.key}",
+        progress=progress,
     )
     return dest
 
@@ -320,6 +355,10 @@ def download_all(
     Downloads a set of upstream sources listed in the
     [`SOURCES`][kotobase.db.builder.config.SOURCES] dictionary
 
+    Up to [`_DOWNLOAD_WORKERS`][kotobase.db.builder.download._DOWNLOAD_WORKERS]
+    sources are downloaded at the same time, sharing one session and one
+    progress bar
+
     Optional sources that fail to download are skipped with a warning rather
     than aborting the whole run. A failure of a required source is raised
 
@@ -345,10 +384,24 @@ def download_all(
             keys += [k for k, source in SOURCES.items() if source.optional]
 
     result: dict[str, Path] = {}
-    for key in keys:
+    with (
+        download_progress_bar() as progress,
+        ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as pool,
+    ):
+        futures: dict[str, Future[Path]] = {
+            key: pool.submit(
+                download,
+                SOURCES[key],
+                force=force,
+                session=session,
+                progress=progress,
+            )
+            for key in keys
+        }
+    for key, future in futures.items():
         source = SOURCES[key]
         try:
-            result[key] = download(source, force=force, session=session)
+            result[key] = future.result()
         except DownloadError as e:
             if source.optional:
                 THEMED_CONSOLE.print(
@@ -401,7 +454,7 @@ def _download_and_decompress(url: str, destination: Path, label: str) -> None:
                 task = progress.add_task(label, total=total_download)
                 # Iterate over the compressed network chunks
                 chunk: bytes
-                for chunk in response.iter_content(chunk_size=65536):
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                     # Decompresses the compressed chunks and writes them to
                     # part which results in a bigger `written` chunk
                     total_uncompressed_written += writer.write(chunk)
@@ -45,6 +45,7 @@ from __future__ import annotations
 import bz2
 import csv
 import gzip
+import io
 import json
 import logging
 import re
@@ -53,13 +54,32 @@ import zipfile
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, TypeAlias
+from typing import IO, Any, TypeAlias, cast
 
 from lxml import etree
 
 from ...exceptions import MalformedSourceError, SourceExtractionError
 from . import config
 
+# --- Optional Build Accelerators ---
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - Depends On The `build` Extra
+    ijson = None
+
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - Depends On The `build` Extra
+    _HAVE_ORJSON = False
+
+try:
+    from isal import igzip
+except ImportError:  # pragma: no cover - Depends On The `build` Extra
+    igzip = None
+
 # --- Module Logger ---
 
 LOGGER = logging.getLogger(__name__)
@@ -117,10 +137,37 @@ class Extractor:
 # --- Shared Parsing Helpers ---
 
 
+_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    check_circular=False,
+)
+"""
+The standard library encoder used by `_to_json` when `orjson` is missing
+
+info: Settings
+    - `separators=(",", ":")` &rarr; Compact output without the default
+      spaces, matching what `orjson` writes
+
+    - `check_circular=False` &rarr; Skip tracking visited containers, the
+      encoded values are small, freshly parsed and never cyclic
+
+    - The encoder is built once, whereas `json.dumps` with any non default
+      argument constructs a new encoder on every call
+"""
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+"""
+The `UTF-8` byte order mark some upstream `JSON` files may start with, which
+`json` skips but `orjson` and `ijson` reject
+"""
+
+
 def _to_json(value: Any) -> str:
     """
     Serialize a value to compact `JSON` text for a `JSON` column using
-    `json.dumps`
+    `orjson` when the optional `build` extra is installed, or the standard
+    library's `_JSON_ENCODER` otherwise
 
     Japanese text is kept verbatim rather than escaped to `\\uXXXX` so
     that the stored columns stay readable (`ensure_ascii=False`)
@@ -131,7 +178,61 @@ def _to_json(value: Any) -> str:
     Returns:
         The `JSON` encoded value with non ASCII characters kept verbatim
     """
-    return json.dumps(value, ensure_ascii=False)
+    if _HAVE_ORJSON:
+        return orjson.dumps(value).decode("utf-8")
+    return _JSON_ENCODER.encode(value)
+
+
+def _load_json(data: bytes) -> Any:
+    """
+    Decode a whole `JSON` document with `orjson` when the optional `build`
+    extra is installed, or `json.loads` otherwise
+
+    A leading `UTF-8` byte order mark is dropped first, since `orjson` refuses
+    it where `json.loads` accepts it
+
+    Args:
+        data (bytes): The `UTF-8` encoded document
+
+    Returns:
+        The decoded value
+    """
+    data = data.removeprefix(_UTF8_BOM)
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_json_array(handle: IO[bytes]) -> Iterator[Any]:
+    """
+    Stream the items of a top level `JSON` array
+
+    info: Parsing
+        - With the optional `build` extra installed, the array is parsed
+          incrementally by `ijson`, so only one item is held in memory at a
+          time rather than the whole decoded document
+
+        - Without it, the document is decoded at once with
+          [`_load_json`][kotobase.db.builder.extractors._load_json]
+
+        - `ijson` rejects a leading `UTF-8` byte order mark, so the first
+          bytes are peeked and skipped when they are one, otherwise the
+          handle is moved back to where it started
+
+    Args:
+        handle (IO[bytes]): Seekable binary file object positioned at the
+            start of the document
+
+    Yields:
+        Each decoded item of the array
+    """
+    if ijson is None:
+        yield from _load_json(handle.read())
+        return
+    head = handle.read(len(_UTF8_BOM))
+    if head != _UTF8_BOM:
+        handle.seek(-len(head), io.SEEK_CUR)
+    yield from ijson.items(handle, "item", use_float=True)
 
 
 def _texts(elements: Iterable[etree._Element]) -> list[str]:
@@ -190,6 +291,26 @@ def _require_int(value: str | None) -> int:
         ) from e
 
 
+def _open_gzip(path: Path) -> IO[bytes]:
+    """
+    Open a gzipped file for binary streaming reads
+
+    With the optional `build` extra installed, the file is decompressed by
+    `isal.igzip`, which uses the `ISA-L` SIMD inflate routines and is several
+    times faster than the `zlib` backed `gzip` module it otherwise falls back
+    to
+
+    Args:
+        path (Path): Path of the gzipped file
+
+    Returns:
+        A binary file object yielding the decompressed bytes
+    """
+    if igzip is not None:
+        return cast(IO[bytes], igzip.open(path, "rb"))
+    return cast(IO[bytes], gzip.open(path, "rb"))
+
+
 def stream_elements(
     path: Path,
     tag: str,
@@ -210,6 +331,16 @@ def stream_elements(
         - The element is still fully populated while the caller holds it, so
           all reads must happen inside the loop body before the next iteration
 
+        - `collect_ids=False` skips building the `xml:id` hash table, which
+          no extractor queries. `libxml2`'s limits on text node size and tree
+          depth are left in place, since entities are resolved in files
+          downloaded over the network
+
+        - `remove_blank_text`, `remove_comments` and `remove_pis` drop the
+          indentation whitespace, comments and processing instructions, so
+          each element carries only the children the extractors read, which
+          also keeps the serialized `KanjiVG` markup lean
+
     Args:
         path (Path): Path of the gzipped XML file
         tag (str): The element tag to emit, such as `entry` or `character`
@@ -220,12 +351,16 @@ def stream_elements(
         Each finished element of the requested tag, cleared once the caller
             moves on
     """
-    with gzip.open(path, "rb") as handle:
+    with _open_gzip(path) as handle:
         context = etree.iterparse(
             handle,
             events=("end",),
             tag=tag,
             resolve_entities=resolve_entities,
+            collect_ids=False,
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
         )
         for _event, element in context:
             yield element
@@ -256,9 +391,15 @@ class TagResolver:
           back into the code, while the description is emitted into the `tag`
           table of the database
 
+        - Codes returned by `codes` are the resolver's own dictionary values,
+          so every occurrence of a tag across the file shares one string
+          object rather than allocating a copy per element
+
     Attributes:
         code_to_desc (dict[str, str]): Mapping of each tag code to its
             description
+        _emitted (set[tuple[str, str]]): The `(code, category)` primary keys
+            already yielded by `tag_rows`
     """
 
     _ENTITY_RE = re.compile(r'<!ENTITY\s+(\S+)\s+"([^"]*)">')
@@ -277,6 +418,7 @@ class TagResolver:
         self._desc_to_code = {
             description: code for code, description in code_to_desc.items()
         }
+        self._emitted: set[tuple[str, str]] = set()
 
     @classmethod
     def from_dtd(cls, path: Path, *, stop: str) -> TagResolver:
@@ -296,7 +438,7 @@ class TagResolver:
             A resolver populated from the file's entity table
         """
         entities: dict[str, str] = {}
-        with gzip.open(path, "rt", encoding="utf-8") as handle:
+        with io.TextIOWrapper(_open_gzip(path), encoding="utf-8") as handle:
             for line in handle:
                 match = cls._ENTITY_RE.search(line)
                 if match:
@@ -333,25 +475,30 @@ class TagResolver:
         category: str,
     ) -> Iterator[DatabaseRow]:
         """
-        Emit `tag` rows for every element that resolves to a known code
+        Emit `tag` rows for every element that resolves to a new known code
 
         This is the additional extractor for the `tags` table of the database,
         shared by both `JMDict` and `JMNedict`
 
+        The same handful of tags repeats across hundreds of thousands of
+        senses, so each `(code, category)` pair is yielded only the first time
+        it is seen instead of leaving the duplicates to `INSERT OR IGNORE`
+
         Args:
             elements (Iterable[etree._Element]): Elements whose text is a
                 resolved entity description
             category (str): The tag category to record, such as `pos` or `misc`
 
         Yields:
-            One `tag` row per element with a known code
+            One `tag` row per element with a known, not yet emitted code
         """
         for element in elements:
             text = element.text
             if text is None:
                 continue
             code = self._desc_to_code.get(text)
-            if code is not None:
+            if code is not None and (code, category) not in self._emitted:
+                self._emitted.add((code, category))
                 yield (
                     "tag",
                     {
@@ -410,12 +557,6 @@ def _read_tar_bz2_member(path: Path, suffix: str) -> Iterator[list[str]]:
 
 # --- JMdict ---
 
-_NF_RE = re.compile(r"nf(\d+)")
-"""
-Matches a JMdict `nfXX` corpus frequency band code and captures the band
-number, where a lower number is more frequent
-"""
-
 _COMMON_PRIORITY = frozenset({"news1", "ichi1", "spec1", "spec2", "gai1"})
 """
 Priority codes that mark a `JMdict` written or read form as `common` when any
@@ -455,12 +596,14 @@ def _freq_rank(codes: list[str]) -> int | None:
     Returns:
         The smallest `nfXX` band as an integer, or None when no band is present
     """
-    bands = [
-        int(match.group(1))
-        for code in codes
-        if (match := _NF_RE.fullmatch(code))
-    ]
-    return min(bands) if bands else None
+    # One pass with plain string checks, called for every entry
+    best: int | None = None
+    for code in codes:
+        if code.startswith("nf") and code[2:].isdecimal():
+            band = int(code[2:])
+            if best is None or band < best:
+                best = band
+    return best
 
 
 def extract_jmdict(path: Path) -> Iterator[DatabaseRow]:
@@ -714,6 +857,36 @@ def extract_jmnedict(path: Path) -> Iterator[DatabaseRow]:
 
 # --- KanjiDic2 ---
 
+_KD_STROKES = etree.XPath("misc/stroke_count")
+_KD_RADICALS = etree.XPath("radical/rad_value")
+_KD_CODEPOINTS = etree.XPath("codepoint/cp_value")
+_KD_VARIANTS = etree.XPath("misc/variant")
+_KD_DIC_REFS = etree.XPath("dic_number/dic_ref")
+_KD_QUERY_CODES = etree.XPath("query_code/q_code")
+_KD_READINGS = etree.XPath("reading_meaning/rmgroup/reading")
+_KD_MEANINGS = etree.XPath("reading_meaning/rmgroup/meaning")
+_KD_NANORI = etree.XPath("reading_meaning/nanori")
+"""
+Compiled paths from a `<character>` to each of its repeated detail elements
+
+They are compiled once at import, so every character is walked by `libxml2`
+in a single call per path rather than by nested `find` and `findall` calls
+"""
+
+
+def _nodes(path: etree.XPath, element: etree._Element) -> list[etree._Element]:
+    """
+    Evaluate a compiled element path against an element
+
+    Args:
+        path (etree.XPath): A compiled path that selects only elements
+        element (etree._Element): The context element
+
+    Returns:
+        The selected elements in document order
+    """
+    return cast(list[etree._Element], path(element))
+
 
 def extract_kanjidic(path: Path) -> Iterator[DatabaseRow]:
     """
@@ -765,20 +938,20 @@ def extract_kanjidic(path: Path) -> Iterator[DatabaseRow]:
         # A character may list more than one stroke count, the first is the
         # accepted value and the rest are common miscounts kept for reference.
         strokes = [
-            _optional_int(s.text)
-            for s in (misc.findall("stroke_count") if misc is not None else [])
+            stroke
+            for stroke in (
+                _optional_int(s.text) for s in _nodes(_KD_STROKES, char)
+            )
+            if stroke is not None
         ]
-        strokes = [s for s in strokes if s is not None]
 
         rad_classical = None
         rad_nelson = None
-        radical = char.find("radical")
-        if radical is not None:
-            for value in radical.findall("rad_value"):
-                if value.get("rad_type") == "classical":
-                    rad_classical = _optional_int(value.text)
-                elif value.get("rad_type") == "nelson_c":
-                    rad_nelson = _optional_int(value.text)
+        for value in _nodes(_KD_RADICALS, char):
+            if value.get("rad_type") == "classical":
+                rad_classical = _optional_int(value.text)
+            elif value.get("rad_type") == "nelson_c":
+                rad_nelson = _optional_int(value.text)
 
         yield (
             "kanji",
@@ -800,98 +973,84 @@ def extract_kanjidic(path: Path) -> Iterator[DatabaseRow]:
             },
         )
 
-        codepoint = char.find("codepoint")
-        if codepoint is not None:
-            for value in codepoint.findall("cp_value"):
-                yield (
-                    "kanji_codepoint",
-                    {
-                        "literal": literal,
-                        "type": value.get("cp_type"),
-                        "value": value.text,
-                    },
-                )
+        for value in _nodes(_KD_CODEPOINTS, char):
+            yield (
+                "kanji_codepoint",
+                {
+                    "literal": literal,
+                    "type": value.get("cp_type"),
+                    "value": value.text,
+                },
+            )
 
-        if misc is not None:
-            for value in misc.findall("variant"):
-                yield (
-                    "kanji_variant",
-                    {
-                        "literal": literal,
-                        "type": value.get("var_type"),
-                        "value": value.text,
-                    },
-                )
+        for value in _nodes(_KD_VARIANTS, char):
+            yield (
+                "kanji_variant",
+                {
+                    "literal": literal,
+                    "type": value.get("var_type"),
+                    "value": value.text,
+                },
+            )
 
-        dic_number = char.find("dic_number")
-        if dic_number is not None:
-            for ref in dic_number.findall("dic_ref"):
-                extra = None
-                if ref.get("m_vol") or ref.get("m_page"):
-                    extra = _to_json(
-                        {"vol": ref.get("m_vol"), "page": ref.get("m_page")}
-                    )
-                yield (
-                    "kanji_dic_ref",
-                    {
-                        "literal": literal,
-                        "type": ref.get("dr_type"),
-                        "value": ref.text,
-                        "extra": extra,
-                    },
+        for ref in _nodes(_KD_DIC_REFS, char):
+            extra = None
+            if ref.get("m_vol") or ref.get("m_page"):
+                extra = _to_json(
+                    {"vol": ref.get("m_vol"), "page": ref.get("m_page")}
                 )
+            yield (
+                "kanji_dic_ref",
+                {
+                    "literal": literal,
+                    "type": ref.get("dr_type"),
+                    "value": ref.text,
+                    "extra": extra,
+                },
+            )
 
-        query_code = char.find("query_code")
-        if query_code is not None:
-            for code in query_code.findall("q_code"):
-                yield (
-                    "kanji_query_code",
-                    {
-                        "literal": literal,
-                        "type": code.get("qc_type"),
-                        "value": code.text,
-                        "skip_misclass": code.get("skip_misclass"),
-                    },
-                )
+        for code in _nodes(_KD_QUERY_CODES, char):
+            yield (
+                "kanji_query_code",
+                {
+                    "literal": literal,
+                    "type": code.get("qc_type"),
+                    "value": code.text,
+                    "skip_misclass": code.get("skip_misclass"),
+                },
+            )
 
-        reading_meaning = char.find("reading_meaning")
-        if reading_meaning is not None:
-            reading_pos = 0
-            meaning_pos = 0
-            for group in reading_meaning.findall("rmgroup"):
-                for reading in group.findall("reading"):
-                    yield (
-                        "kanji_reading",
-                        {
-                            "literal": literal,
-                            "type": reading.get("r_type"),
-                            "value": reading.text,
-                            "position": reading_pos,
-                        },
-                    )
-                    reading_pos += 1
-                for meaning in group.findall("meaning"):
-                    yield (
-                        "kanji_meaning",
-                        {
-                            "literal": literal,
-                            "lang": meaning.get("m_lang", "en"),
-                            "value": meaning.text,
-                            "position": meaning_pos,
-                        },
-                    )
-                    meaning_pos += 1
-            for position, nanori in enumerate(
-                reading_meaning.findall("nanori")
-            ):
-                yield (
-                    "kanji_nanori",
-                    {
-                        "literal": literal,
-                        "value": nanori.text,
-                        "position": position,
-                    },
-                )
+        # Positions run across every `rmgroup`, which the compiled paths
+        # already return in document order
+        for position, reading in enumerate(_nodes(_KD_READINGS, char)):
+            yield (
+                "kanji_reading",
+                {
+                    "literal": literal,
+                    "type": reading.get("r_type"),
+                    "value": reading.text,
+                    "position": position,
+                },
+            )
+        for position, meaning in enumerate(_nodes(_KD_MEANINGS, char)):
+            yield (
+                "kanji_meaning",
+                {
+                    "literal": literal,
+                    "lang": meaning.get("m_lang", "en"),
+                    "value": meaning.text,
+                    "position": position,
+                },
+            )
+        for position, nanori in enumerate(_nodes(_KD_NANORI, char)):
+            yield (
+                "kanji_nanori",
+                {
+                    "literal": literal,
+                    "value": nanori.text,
+                    "position": position,
+                },
+            )
 
 
 # --- KRADFILE and RADKFILE ---
@@ -1011,17 +1170,15 @@ def extract_furigana(path: Path) -> Iterator[DatabaseRow]:
         handle = archive.extractfile(member)
         if handle is None:
             raise SourceExtractionError(f"Couldn't Read '{member.name}'")
-        records = json.load(handle)
-
-    for record in records:
-        yield (
-            "furigana",
-            {
-                "text": record["text"],
-                "reading": record["reading"],
-                "segments": _to_json(record["furigana"]),
-            },
-        )
+        for record in _iter_json_array(handle):
+            yield (
+                "furigana",
+                {
+                    "text": record["text"],
+                    "reading": record["reading"],
+                    "segments": _to_json(record["furigana"]),
+                },
+            )
 
 
 # --- KanjiVG ---
@@ -1086,7 +1243,7 @@ def _load_jlpt(kind: str, level: int) -> list[dict[str, Any]]:
         The decoded list of records from the file
     """
     path = config.jlpt_file(kind, level)
-    data: list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+    data: list[dict[str, Any]] = _load_json(path.read_bytes())
     return data
 
 
@@ -0,0 +1,237 @@
+"""
+Defines the in-process result cache shared by kotobase's
+[`Repos`][kotobase.db.repos]
+
+abstract: Caching Policy
+    - Dictionary lookups follow a heavily skewed (Zipfian) distribution, a few
+      headwords are requested over and over while the long tail is rarely
+      seen twice
+
+    - A least-recently-used policy lets a burst of one-off lookups flush those
+      hot entries, so the cache evicts the *least frequently* used key
+      instead, breaking ties between equally used keys by age
+
+info: Thread Safety
+    - Every operation runs under a lock, so one cache instance can be shared
+      by repositories running on different threads
+
+    - The lock is only held for the bookkeeping, never while a value is being
+      computed, so a slow query on one thread does not block cache hits on
+      another
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+# --- Typing Helpers ---
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+_D = TypeVar("_D")
+
+
+class LFUCache(Generic[_K, _V]):
+    """
+    Bounded, thread-safe least-frequently-used mapping
+
+    info: Bookkeeping
+        - Each key carries a hit counter and sits in the bucket for that
+          count, buckets being insertion-ordered dicts, so a lookup, an
+          insert and an eviction are all `O(1)`
+
+        - Evicting takes the oldest key of the lowest-count bucket. The next
+          lowest count is only searched for when a single insert has to
+          evict from more than one bucket
+
+    info: Weighted Entries
+        - By default every entry weighs `1`, so `maxsize` is an entry count
+
+        - With `getsizeof`, each entry weighs what that function returns, for
+          example the number of DTOs in a result list, and entries are evicted
+          until the total weight fits `maxsize` again
+
+        - A value heavier than `maxsize` on its own is never stored
+
+    Attributes:
+        maxsize (int): The maximum total weight held at once, where a value of
+            `0` or less disables caching
+        currsize (int): The total weight currently held
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        getsizeof: Callable[[_V], int] | None = None,
+    ) -> None:
+        """
+        Create an empty cache
+
+        Args:
+            maxsize (int): The maximum total weight held at once
+            getsizeof (Callable[[_V], int] | None): Returns the weight of a
+                value, or None to weigh every value as `1`
+        """
+        self.maxsize = maxsize
+        self.currsize = 0
+        self._getsizeof = getsizeof
+        self._lock = threading.Lock()
+        self._values: dict[_K, _V] = {}
+        self._sizes: dict[_K, int] = {}
+        self._counts: dict[_K, int] = {}
+        self._buckets: dict[int, dict[_K, None]] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            The number of entries currently held
+        """
+        with self._lock:
+            return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check for a key without counting it as a use
+
+        Args:
+            key (object): The key to look for
+
+        Returns:
+            True when the key is currently held
+        """
+        with self._lock:
+            return key in self._values
+
+    def get(self, key: _K, default: _D) -> _V | _D:
+        """
+        Look up a key, counting a hit as one more use
+
+        Args:
+            key (_K): The key to look up
+            default (_D): The value to return on a miss, usually a sentinel
+                since `None` is a valid cached value
+
+        Returns:
+            The cached value, or `default` when the key is not held
+        """
+        with self._lock:
+            if key not in self._values:
+                return default
+            self._touch(key)
+            return self._values[key]
+
+    def put(self, key: _K, value: _V) -> None:
+        """
+        Store a value, evicting the least frequently used entries until it
+        fits
+
+        Storing an already held key replaces its value and counts as a use.
+        A value too heavy to store drops the key's old value instead of
+        leaving it cached
+
+        Args:
+            key (_K): The key to store under
+            value (_V): The value to store
+        """
+        size = 1 if self._getsizeof is None else self._getsizeof(value)
+        with self._lock:
+            if size > self.maxsize:
+                if key in self._values:
+                    self._remove(key)
+                return
+            if key in self._values:
+                self.currsize -= self._sizes[key]
+                self._values[key] = value
+                self._sizes[key] = size
+                self.currsize += size
+                self._touch(key)
+                self._shrink(self.maxsize)
+                return
+            self._shrink(self.maxsize - size)
+            self._values[key] = value
+            self._sizes[key] = size
+            self.currsize += size
+            self._counts[key] = 1
+            self._buckets.setdefault(1, {})[key] = None
+            self._min_count = 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry
+        """
+        with self._lock:
+            self._values.clear()
+            self._sizes.clear()
+            self.currsize = 0
+            self._counts.clear()
+            self._buckets.clear()
+            self._min_count = 0
+
+    def _touch(self, key: _K) -> None:
+        """
+        Move a held key up to the next use-count bucket
+
+        Must be called with the lock held
+
+        Args:
+            key (_K): The key that was just used
+        """
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, {})[key] = None
+
+    def _shrink(self, limit: int) -> None:
+        """
+        Evict least frequently used keys until the total weight fits `limit`
+
+        Must be called with the lock held
+
+        An eviction that empties the lowest bucket leaves `_min_count`
+        pointing at it, which is fine when an insert follows and resets it
+        to `1`. Only when the same call has to evict again is the next lowest
+        count looked up, so a full cache taking one-off keys stays `O(1)` per
+        insert
+
+        Args:
+            limit (int): The total weight to get down to
+        """
+        while self.currsize > limit:
+            if self._min_count not in self._buckets:
+                self._min_count = min(self._buckets)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove the oldest key among the least frequently used ones
+
+        Must be called with the lock held on a non-empty cache whose
+        `_min_count` bucket exists
+        """
+        self._remove(next(iter(self._buckets[self._min_count])))
+
+    def _remove(self, key: _K) -> None:
+        """
+        Unlink a held key from the values, its bucket and the total weight
+
+        Must be called with the lock held
+
+        Args:
+            key (_K): The key to remove
+        """
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+        del self._values[key]
+        self.currsize -= self._sizes.pop(key)
@@ -24,12 +24,26 @@ info: Error Handling
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable, Sequence
-from typing import Any, ParamSpec, TypeVar
-
-from sqlalchemy import ColumnElement, func, select, text
+import itertools
+import os
+import weakref
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any, ClassVar, Concatenate, ParamSpec, TypeVar, cast
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    CompoundSelect,
+    Select,
+    String,
+    bindparam,
+    func,
+    select,
+    text,
+    type_coerce,
+    union_all,
+)
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from ..exceptions import (
     AudioDatabaseNotFoundError,
@@ -37,6 +51,7 @@ from ..exceptions import (
     KotobaseError,
 )
 from . import dtos
+from .cache import LFUCache
 from .models import (
     Audio,
     Furigana,
@@ -66,6 +81,8 @@ from .models import (
 _P = ParamSpec("_P")
 _R = TypeVar("_R")
 _T = TypeVar("_T", bound=type)
+_S = TypeVar("_S", bound="KotobaseRepo")
+_Q = TypeVar("_Q", bound=Select[Any])
 
 # --- Eager Loading Helpers ---
 _KANJI_LOAD = (
@@ -102,6 +119,36 @@ _JMNEDICT_LOAD = (
 Eager-loading configuration for `JMNedict` entries
 """
 
+ENV_STRICT_LOAD = "KOTOBASE_STRICT_LOAD"
+"""
+Defines the name of the environment variable that, when set to anything other
+than an empty string or `0`, makes searches refuse any relationship load that
+their eager-loading configuration does not cover
+"""
+
+
+def _strict(statement: _Q) -> _Q:
+    """
+    Return a statement, made strict about relationship loading on request
+
+    When `KOTOBASE_STRICT_LOAD` is enabled, `raiseload('*')` is added so
+    touching any relationship outside the statement's eager-loading options
+    raises instead of silently issuing one lazy query per row (an `N+1`
+    pattern). The variable is read on every call, so it can be toggled without
+    re-importing the module
+
+    Args:
+        statement (_Q): The select to run
+
+    Returns:
+        `statement` unchanged, or a copy carrying `raiseload('*')` when strict
+            loading is enabled
+    """
+    if os.environ.get(ENV_STRICT_LOAD, "") in ("", "0"):
+        return statement
+    return statement.options(raiseload("*"))
+
+
 # --- Ordering Helpers ---
 
 _JMDICT_ORDER = (
@@ -178,6 +225,140 @@ _SVG_CLOSE = "</g></svg>"
 Closing of a renderable KanjiVG document, matching `_SVG_OPEN`
 """
 
+# --- LIKE Helpers ---
+
+
+def _like_literal(value: str) -> tuple[str, str | None]:
+    """
+    Escape a literal for use inside a SQL `LIKE` pattern, only when needed
+
+    Most queries carry no `%` or `_`, so they are returned unchanged with no
+    escape character, which keeps the generated SQL free of an `ESCAPE`
+    clause. When either metacharacter is present, `\\`, `%` and `_` are
+    prefixed with `\\` and `\\` is returned as the escape character
+
+    Args:
+        value (str): The literal text to embed in a pattern
+
+    Returns:
+        The (possibly escaped) text and the escape character to pass as
+            `like(..., escape=)`, or `None` when no escaping was needed
+    """
+    if "%" not in value and "_" not in value:
+        return value, None
+    escaped = (
+        value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return escaped, "\\"
+
+
+@functools.lru_cache(maxsize=256)
+def _normalise_wildcard(query: str) -> str | None:
+    """
+    Translate a wildcard query into a `LIKE` pattern
+
+    `*` is translated to `%`. A query made only of wildcards (`*`, `%`, `_`)
+    has no literal to search for and would only scan the whole table for up
+    to `limit` arbitrary rows, so it is rejected by returning `None`. The
+    function is pure, so recent queries are memoized
+
+    Args:
+        query (str): The wildcard query
+
+    Returns:
+        The `LIKE` pattern, or `None` when the query holds no literal character
+    """
+    pattern = query.replace("*", "%")
+    if not pattern.strip("%_"):
+        return None
+    return pattern
+
+
+# --- Form Search Helpers ---
+
+
+def _form_entry_ids(
+    kanji: type[JMDictKanji] | type[JMnedictKanji],
+    kana: type[JMDictKana] | type[JMnedictKana],
+    *,
+    wildcard: bool,
+) -> CompoundSelect[tuple[int]]:
+    """
+    Build the set of entry ids that own a form matching the `form` parameter
+
+    Each form table is searched on its own indexed `text` column and the two
+    `entry_id` selects are combined with `UNION ALL`, so the caller can
+    hydrate entries with `id IN (...)`. An entry matching through both a kanji
+    and a kana form appears twice, which `IN` ignores, so no de-duplicating
+    `UNION` sort is needed. Compared to `EXISTS` over each relationship
+    joined with `OR`, which makes SQLite walk every entry and probe both form
+    tables per row, this starts from the few matching forms
+
+    Args:
+        kanji (type[JMDictKanji] | type[JMnedictKanji]): The kanji form model
+        kana (type[JMDictKana] | type[JMnedictKana]): The kana form model
+        wildcard (bool): When True, match the bound `form` as a `LIKE`
+            pattern, otherwise match it exactly
+
+    Returns:
+        A `UNION ALL` of the owning entry ids of every matching form
+    """
+    form = bindparam("form", type_=String)
+    if wildcard:
+        return union_all(
+            select(kanji.entry_id).where(kanji.text.like(form)),
+            select(kana.entry_id).where(kana.text.like(form)),
+        )
+    return union_all(
+        select(kanji.entry_id).where(kanji.text == form),
+        select(kana.entry_id).where(kana.text == form),
+    )
+
+
+# --- Prebuilt Statements ---
+
+_JMDICT_FORM_SEARCH = {
+    wildcard: select(JMDictEntry)
+    .where(
+        JMDictEntry.id.in_(
+            _form_entry_ids(JMDictKanji, JMDictKana, wildcard=wildcard)
+        )
+    )
+    .options(*_JMDICT_LOAD)
+    .order_by(*_JMDICT_ORDER)
+    .limit(bindparam("limit"))
+    for wildcard in (False, True)
+}
+"""
+`JMdict` form search statements keyed by `wildcard`, taking the `form` and
+`limit` parameters
+"""
+
+_JMNEDICT_FORM_SEARCH = {
+    wildcard: select(JMnedictEntry)
+    .where(
+        JMnedictEntry.id.in_(
+            _form_entry_ids(JMnedictKanji, JMnedictKana, wildcard=wildcard)
+        )
+    )
+    .options(*_JMNEDICT_LOAD)
+    .order_by(JMnedictEntry.id)
+    .limit(bindparam("limit"))
+    for wildcard in (False, True)
+}
+"""
+`JMnedict` form search statements keyed by `wildcard`, taking the `form` and
+`limit` parameters
+"""
+
+_KANJI_LEVELS = select(JlptKanji.kanji, JlptKanji.level).where(
+    JlptKanji.kanji.in_(bindparam("literals", expanding=True))
+)
+"""
+Tanos JLPT level lookup, taking the `literals` list as an expanding `IN`
+parameter so one cached compiled form serves any number of kanji
+"""
+
 
 # --- Exception Handling Helpers ---
 
@@ -215,6 +396,139 @@ def _wrap_sqlalchemy_error(method: Callable[_P, _R]) -> Callable[_P, _R]:
     return wrapper
 
 
+# --- Caching Helpers ---
+
+_LOOKUP_CACHE: LFUCache[Hashable, Any] = LFUCache(maxsize=10_000)
+"""
+Process-wide cache of single-row lookup results shared by every repository,
+so all of them draw from one memory budget. 10,000 rows cover the hot head of
+a Zipfian lookup stream without holding a sizeable share of JMdict's roughly
+200,000 fully nested entries in memory
+"""
+
+_SEARCH_CACHE: LFUCache[Hashable, Any] = LFUCache(
+    maxsize=10_000, getsizeof=lambda rows: max(1, len(rows))
+)
+"""
+Process-wide cache of form search results, weighted by the number of DTOs in
+each result so a few broad searches cannot pin an unbounded amount of memory.
+Empty results still weigh `1` so misses are bounded too. The 10,000 DTO budget
+matches `_LOOKUP_CACHE`, hundreds of typical searches, while one unlimited
+wildcard search heavier than that is simply not stored
+"""
+
+_ENGINE_KEYS: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+"""
+Stable integer ids handed out to engines by `_engine_key`, held weakly so a
+discarded engine is not kept alive by the caches
+"""
+
+_ENGINE_COUNTER = itertools.count()
+"""
+Source of the ids `_engine_key` assigns, never reused within a process
+"""
+
+_MISSING = object()
+"""
+Sentinel marking a cache miss, since `None` is a valid cached result
+"""
+
+_VOCAB_KEY = "JLPTRepo.vocab_by_words"
+"""
+Key prefix of the per-word entries `JLPTRepo.vocab_by_words` keeps in
+`_LOOKUP_CACHE`
+"""
+
+
+def _engine_key(session: Session) -> int:
+    """
+    Identify the database a session is bound to for use in cache keys
+
+    Keys carry this integer rather than the engine itself, so a cache never
+    keeps an engine, and its connection pool, alive. Ids are never reused,
+    unlike `id()`, so a new engine cannot be served a dead engine's results
+
+    Args:
+        session (Session): The session whose engine to identify
+
+    Returns:
+        The engine's id, assigned on first use
+    """
+    return _ENGINE_KEYS.setdefault(session.get_bind(), next(_ENGINE_COUNTER))
+
+
+def _detached(value: Any) -> Any:
+    """
+    Copy a cached result so the caller gets DTOs nobody else holds
+
+    The DTOs are ordinary mutable pydantic models, so handing the cached
+    instances out would let one caller's edit leak into every later hit
+
+    Args:
+        value (Any): A DTO, a list or tuple of DTOs, or `None`
+
+    Returns:
+        A deep copy of a DTO, a new list of deep copies for a list or tuple,
+        or the value itself when there is nothing to copy
+    """
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, (list, tuple)):
+        return [_detached(item) for item in value]
+    return value
+
+
+def _cached(
+    cache: LFUCache[Hashable, Any],
+) -> Callable[
+    [Callable[Concatenate[_S, _P], _R]],
+    Callable[Concatenate[_S, _P], _R],
+]:
+    """
+    Memoize a repository method's DTO results in an `LFUCache`
+
+    The key is the method's `__qualname__`, the `_engine_key` of the engine
+    the repository's session is bound to, and the call arguments, so several
+    methods can share one cache and results from different databases never
+    mix. A fresh engine, such as the one created after the cached engine is
+    reset, therefore starts from an empty key space. The cached DTOs never
+    leave the cache, every call, including the one that filled it, returns a
+    deep copy, so a caller mutating its result cannot change what later
+    callers receive
+
+    Args:
+        cache (LFUCache[Hashable, Any]): The cache to store results in
+
+    Returns:
+        A decorator that wraps the method with the cache lookup
+    """
+
+    def decorator(
+        method: Callable[Concatenate[_S, _P], _R],
+    ) -> Callable[Concatenate[_S, _P], _R]:
+        @functools.wraps(method)
+        def wrapper(self: _S, /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+            key = (
+                method.__qualname__,
+                _engine_key(self.session),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            hit = cache.get(key, _MISSING)
+            if hit is not _MISSING:
+                return cast(_R, _detached(hit))
+            result = method(self, *args, **kwargs)
+            if isinstance(result, list):
+                cache.put(key, tuple(result))
+            else:
+                cache.put(key, result)
+            return cast(_R, _detached(result))
+
+        return wrapper
+
+    return decorator
+
+
 # --- Base Repository Class ---
 
 
@@ -280,13 +594,15 @@ class JMDictRepo(KotobaseRepo):
     with `model_validate`
     """
 
+    @_cached(_LOOKUP_CACHE)
     def by_id(self, entry_id: int) -> dtos.JMDictEntryDTO | None:
         """
         Fetch one entry by its `JMdict` sequence number
 
         Loads the row through `Session.get` with `_JMDICT_LOAD` eager loading
         of its kanji forms, kana forms and senses with glosses, then validates
-        it into a [`JMDictEntryDTO`][kotobase.db.dtos.JMDictEntryDTO]
+        it into a [`JMDictEntryDTO`][kotobase.db.dtos.JMDictEntryDTO]. Results,
+        including misses, are memoized in the shared `_LOOKUP_CACHE`
 
         Args:
             entry_id (int): The `JMdict` sequence number (primary key)
@@ -322,6 +638,7 @@ class JMDictRepo(KotobaseRepo):
         entries = self.session.scalars(statement).all()
         return [dtos.JMDictEntryDTO.model_validate(entry) for entry in entries]
 
+    @_cached(_SEARCH_CACHE)
     def search_form(
         self,
         form: str,
@@ -332,11 +649,15 @@ class JMDictRepo(KotobaseRepo):
         """
         Search entries by a written or reading form
 
-        Matches `form` against `JMDictKanji.text` or `JMDictKana.text` using
-        `EXISTS` (`relationship.any`). By default the comparison is exact. When
+        Runs the prebuilt `_JMDICT_FORM_SEARCH` statement, which matches
+        `form` against `JMDictKanji.text` or `JMDictKana.text` and selects the
+        entries whose id is `IN` the `UNION ALL` of the owning entry ids
+        (`_form_entry_ids`). By default the comparison is exact. When
         `wildcard` is True, `*` is translated to `%` and the form is matched as
-        a SQL `LIKE` pattern. Results are eager-loaded with
-        `_JMDICT_LOAD`, ordered by `_JMDICT_ORDER`, and capped at `limit`
+        a SQL `LIKE` pattern. Results are eager-loaded with `_JMDICT_LOAD`
+        (strict under `KOTOBASE_STRICT_LOAD`), ordered by `_JMDICT_ORDER`,
+        capped at `limit`, and memoized in the DTO-count weighted
+        `_SEARCH_CACHE`
 
         Args:
             form (str): The query form, where `*` and `%` act as wildcards when
@@ -347,28 +668,16 @@ class JMDictRepo(KotobaseRepo):
                 limit
 
         Returns:
-            The matching entries as DTOs, or `[]` when none match
+            The matching entries as DTOs, or `[]` when none match or a
+                wildcard query holds no literal character
         """
-        kanji_match: ColumnElement[bool]
-        kana_match: ColumnElement[bool]
-        if wildcard:
-            pattern = form.replace("*", "%")
-            kanji_match = JMDictKanji.text.like(pattern)
-            kana_match = JMDictKana.text.like(pattern)
-        else:
-            kanji_match = JMDictKanji.text == form
-            kana_match = JMDictKana.text == form
-        statement = (
-            select(JMDictEntry)
-            .where(
-                JMDictEntry.kanji.any(kanji_match)
-                | JMDictEntry.kana.any(kana_match)
-            )
-            .options(*_JMDICT_LOAD)
-            .order_by(*_JMDICT_ORDER)
-            .limit(limit)
-        )
-        entries = self.session.scalars(statement).all()
+        pattern = _normalise_wildcard(form) if wildcard else form
+        if pattern is None:
+            return []
+        entries = self.session.scalars(
+            _strict(_JMDICT_FORM_SEARCH[wildcard]),
+            {"form": pattern, "limit": -1 if limit is None else limit},
+        ).all()
         return [dtos.JMDictEntryDTO.model_validate(entry) for entry in entries]
 
     def search_gloss(
@@ -446,6 +755,7 @@ class JMNeDictRepo(KotobaseRepo):
     `model_validate`
     """
 
+    @_cached(_LOOKUP_CACHE)
     def by_id(self, entry_id: int) -> dtos.JMNeDictEntryDTO | None:
         """
         Fetch one name entry by its `JMnedict` sequence number
@@ -453,7 +763,8 @@ class JMNeDictRepo(KotobaseRepo):
         Loads the row through `Session.get` with `_JMNEDICT_LOAD` eager loading
         of its kanji forms, kana forms and translation blocks with glosses,
         then validates it into a
-        [`JMNeDictEntryDTO`][kotobase.db.dtos.JMNeDictEntryDTO]
+        [`JMNeDictEntryDTO`][kotobase.db.dtos.JMNeDictEntryDTO]. Results,
+        including misses, are memoized in the shared `_LOOKUP_CACHE`
 
         Args:
             entry_id (int): The `JMnedict` sequence number (primary key)
@@ -466,6 +777,7 @@ class JMNeDictRepo(KotobaseRepo):
         )
         return dtos.JMNeDictEntryDTO.model_validate(entry) if entry else None
 
+    @_cached(_SEARCH_CACHE)
     def search(
         self,
         form: str,
@@ -476,12 +788,15 @@ class JMNeDictRepo(KotobaseRepo):
         """
         Search names by a written or reading form
 
-        Matches `form` against `JMnedictKanji.text` or `JMnedictKana.text`
-        with `EXISTS` (`relationship.any`). By default the comparison is exact.
-        When `wildcard` is True, `*` is translated to `%` and the form
-        is matched as a SQL `LIKE` pattern. Results are eager-loaded with
-        `_JMNEDICT_LOAD`, ordered by ascending `JMnedictEntry.id` and capped at
-        `limit`
+        Runs the prebuilt `_JMNEDICT_FORM_SEARCH` statement, which matches
+        `form` against `JMnedictKanji.text` or `JMnedictKana.text` and selects
+        the names whose id is `IN` the `UNION ALL` of the owning entry ids
+        (`_form_entry_ids`). By default the comparison is exact. When
+        `wildcard` is True, `*` is translated to `%` and the form is matched
+        as a SQL `LIKE` pattern. Results are eager-loaded with
+        `_JMNEDICT_LOAD` (strict under `KOTOBASE_STRICT_LOAD`), ordered by
+        ascending `JMnedictEntry.id`, capped at `limit`, and memoized in the
+        DTO-count weighted `_SEARCH_CACHE`
 
         Args:
             form (str): The query form, where `*` and `%` act as wildcards when
@@ -493,27 +808,15 @@ class JMNeDictRepo(KotobaseRepo):
 
         Returns:
             The matching names as DTOs ordered by id, or `[]` when none match
+                or a wildcard query holds no literal character
         """
-        kanji_match: ColumnElement[bool]
-        kana_match: ColumnElement[bool]
-        if wildcard:
-            pattern = form.replace("*", "%")
-            kanji_match = JMnedictKanji.text.like(pattern)
-            kana_match = JMnedictKana.text.like(pattern)
-        else:
-            kanji_match = JMnedictKanji.text == form
-            kana_match = JMnedictKana.text == form
-        statement = (
-            select(JMnedictEntry)
-            .where(
-                JMnedictEntry.kanji.any(kanji_match)
-                | JMnedictEntry.kana.any(kana_match)
-            )
-            .options(*_JMNEDICT_LOAD)
-            .order_by(JMnedictEntry.id)
-            .limit(limit)
-        )
-        entries = self.session.scalars(statement).all()
+        pattern = _normalise_wildcard(form) if wildcard else form
+        if pattern is None:
+            return []
+        entries = self.session.scalars(
+            _strict(_JMNEDICT_FORM_SEARCH[wildcard]),
+            {"form": pattern, "limit": -1 if limit is None else limit},
+        ).all()
         return [
             dtos.JMNeDictEntryDTO.model_validate(entry) for entry in entries
         ]
@@ -530,10 +833,10 @@ class JMNeDictRepo(KotobaseRepo):
         The `name_type` codes of a block are stored as a JSON list in
         `JMnedictTranslation.name_type`, so this matches the quoted code as a
         substring (`LIKE '%"<name_type>"%'`) to find translation blocks of that
-        type, collecting up to `limit` distinct owning `entry_id` values. Those
-        entries are then re-fetched eager-loaded with `_JMNEDICT_LOAD` and
-        ordered by ascending id. When no block matches, returns `[]` without
-        the second query
+        type, collecting up to `limit` distinct owning `entry_id` values. That
+        id-only select is embedded as an `IN` subquery of the entry select, so
+        the ids never round-trip through Python, and the entries are
+        eager-loaded with `_JMNEDICT_LOAD` and ordered by ascending id
 
         Args:
             name_type (str): The name type code such as `place` or `surname`
@@ -542,17 +845,21 @@ class JMNeDictRepo(KotobaseRepo):
         Returns:
             The matching names as DTOs ordered by id, or `[]` when none match
         """
-        entry_ids = self.session.scalars(
+        literal, escape = _like_literal(name_type)
+        entry_ids = (
             select(JMnedictTranslation.entry_id)
-            .where(JMnedictTranslation.name_type.like(f'%"{name_type}"%'))
+            .where(
+                # Match the serialized JSON text, LIKE isn't a JSON operator
+                type_coerce(JMnedictTranslation.name_type, String).like(
+                    f'%"{literal}"%', escape=escape
+                )
+            )
             .distinct()
             .limit(limit)
-        ).all()
-        if not entry_ids:
-            return []
+        )
         entries = self.session.scalars(
             select(JMnedictEntry)
-            .where(JMnedictEntry.id.in_(list(entry_ids)))
+            .where(JMnedictEntry.id.in_(entry_ids))
             .options(*_JMNEDICT_LOAD)
             .order_by(JMnedictEntry.id)
         ).all()
@@ -587,6 +894,20 @@ def _svg_document(fragment: str) -> str:
     return f"{_SVG_OPEN}{fragment[start:end]}{_SVG_CLOSE}"
 
 
+_READING_FIELDS = {
+    "ja_on": "onyomi",
+    "ja_kun": "kunyomi",
+    "pinyin": "pinyin",
+    "korean_r": "korean",
+    "korean_h": "korean",
+}
+"""
+Maps each `KanjiDic2` reading `type` to the
+[`KanjiDTO`][kotobase.db.dtos.KanjiDTO] field it is grouped into, readings of
+any other type are dropped
+"""
+
+
 def _kanji_payload(
     kanji: Kanji,
     radicals: Sequence[str],
@@ -629,7 +950,17 @@ def _kanji_payload(
     query_codes: dict[str, list[str]] = {}
     for code in kanji.query_codes:
         query_codes.setdefault(code.type, []).append(code.value)
-    korean = ("korean_r", "korean_h")
+    # Group readings by their DTO field in one pass, keeping their order
+    readings: dict[str, list[str]] = {
+        "onyomi": [],
+        "kunyomi": [],
+        "pinyin": [],
+        "korean": [],
+    }
+    for reading in kanji.readings:
+        field = _READING_FIELDS.get(reading.type)
+        if field is not None:
+            readings[field].append(reading.value)
     return {
         "literal": kanji.literal,
         "grade": kanji.grade,
@@ -637,11 +968,8 @@ def _kanji_payload(
         "freq": kanji.freq,
         "jlpt_old": kanji.jlpt_old,
         "jlpt_tanos": jlpt_tanos,
-        "onyomi": [r.value for r in kanji.readings if r.type == "ja_on"],
-        "kunyomi": [r.value for r in kanji.readings if r.type == "ja_kun"],
+        **readings,
         "nanori": [n.value for n in kanji.nanori],
-        "pinyin": [r.value for r in kanji.readings if r.type == "pinyin"],
-        "korean": [r.value for r in kanji.readings if r.type in korean],
         "meanings": [m.value for m in kanji.meanings if m.lang == "en"],
         "radicals": list(radicals),
         "dic_refs": {ref.type: ref.value for ref in kanji.dic_refs},
@@ -664,8 +992,27 @@ class KanjiRepo(KotobaseRepo):
     Tanos JLPT level, which are injected through `_kanji_payload` when
     validating each [`KanjiDTO`][kotobase.db.dtos.KanjiDTO]. Also serves
     stroke-order SVG and lookups by SKIP code or scalar attribute
+
+    info: Caching
+        - Built [`KanjiDTO`][kotobase.db.dtos.KanjiDTO] objects are kept in a
+          class-wide `LFUCache` capped at 20,000 entries, enough for every
+          kanji in JIS X 0208 and the common extensions, keyed by the
+          session's `_engine_key` and the literal
+
+        - [`clear`][kotobase.db.repos.KanjiRepo.clear] empties it
     """
 
+    _cache: ClassVar[LFUCache[tuple[int, str], dtos.KanjiDTO]] = LFUCache(
+        maxsize=20_000
+    )
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop every cached kanji profile
+        """
+        cls._cache.clear()
+
     def _radicals(self, literals: Sequence[str]) -> dict[str, list[str]]:
         """
         Fetch the `KRADFILE` radical components grouped by kanji
@@ -694,30 +1041,6 @@ class KanjiRepo(KotobaseRepo):
             grouped.setdefault(literal, []).append(radical)
         return grouped
 
-    def _jlpt_levels(self, literals: Sequence[str]) -> dict[str, int]:
-        """
-        Fetch Tanos JLPT levels keyed by kanji
-
-        Selects `(kanji, level)` rows from
-        [`JlptKanji`][kotobase.db.models.JlptKanji] whose `kanji` is `IN` the
-        given set. An empty `literals` argument returns `{}` without a query
-
-        Args:
-            literals (Sequence[str]): The kanji to look up
-
-        Returns:
-            A mapping of each listed kanji to its Tanos JLPT level, omitting
-                kanji that are not in the Tanos list
-        """
-        if not literals:
-            return {}
-        rows = self.session.execute(
-            select(JlptKanji.kanji, JlptKanji.level).where(
-                JlptKanji.kanji.in_(list(literals))
-            )
-        )
-        return {row.kanji: row.level for row in rows}
-
     def by_literal(self, literal: str) -> dtos.KanjiDTO | None:
         """
         Fetch one kanji with its full profile
@@ -735,51 +1058,68 @@ class KanjiRepo(KotobaseRepo):
         results = self.bulk_fetch([literal])
         return results[0] if results else None
 
-    def bulk_fetch(self, literals: Sequence[str]) -> list[dtos.KanjiDTO]:
+    def bulk_fetch(self, literals: Iterable[str]) -> list[dtos.KanjiDTO]:
         """
         Fetch several kanji at once, preserving first-seen input order
 
-        De-duplicates `literals` while keeping order, then selects the matching
-        [`Kanji`][kotobase.db.models.Kanji] rows (`literal IN ...`)
-        eager-loaded with `_KANJI_LOAD`, and gathers their radical components
-        and Tanos JLPT levels through `_radicals` and `_jlpt_levels`. Each
-        found kanji is built into a [`KanjiDTO`][kotobase.db.dtos.KanjiDTO] via
-        `_kanji_payload`, which injects that kanji's radicals and JLPT level,
-        and the results are emitted in input order. Requested literals with no
-        `kanji` row are skipped, so the result may be shorter than the input.
-        An empty input returns `[]` without a query
+        De-duplicates `literals` while keeping order, consuming the iterable
+        exactly once so a generator works too, and answers each literal from
+        the class-wide cache when it can. The rest are selected from
+        [`Kanji`][kotobase.db.models.Kanji] (`literal IN ...`) eager-loaded
+        with `_KANJI_LOAD`, with each kanji's Tanos JLPT level brought along
+        in the same statement through a `LEFT OUTER JOIN` on
+        [`JlptKanji`][kotobase.db.models.JlptKanji]. Only the literals that
+        were found are passed on to `_radicals`, which is skipped when nothing
+        matched. Each found kanji is built into a
+        [`KanjiDTO`][kotobase.db.dtos.KanjiDTO] via `_kanji_payload`, which
+        injects that kanji's radicals and JLPT level, and the results are
+        emitted in input order as deep copies, so a caller editing one cannot
+        change the cached profile. Requested literals with no `kanji` row are
+        skipped, so the result may be shorter than the input. An empty input
+        returns `[]` without a query
 
         Args:
-            literals (Sequence[str]): The kanji characters to fetch
+            literals (Iterable[str]): The kanji characters to fetch
 
         Returns:
             The matching kanji as DTOs in input order, or `[]` when none match
         """
         ordered = list(dict.fromkeys(literals))
-        if not ordered:
-            return []
-        rows = self.session.scalars(
-            select(Kanji)
-            .where(Kanji.literal.in_(ordered))
-            .options(*_KANJI_LOAD)
-        ).all()
-        by_literal = {row.literal: row for row in rows}
-        radicals = self._radicals(ordered)
-        jlpt = self._jlpt_levels(ordered)
-        result: list[dtos.KanjiDTO] = []
+        bind = _engine_key(self.session)
+        built: dict[str, dtos.KanjiDTO] = {}
+        missing: list[str] = []
         for literal in ordered:
-            kanji = by_literal.get(literal)
-            if kanji is not None:
-                result.append(
-                    dtos.KanjiDTO.model_validate(
-                        _kanji_payload(
-                            kanji,
-                            radicals.get(literal, []),
-                            jlpt.get(literal),
-                        )
-                    )
+            hit = self._cache.get((bind, literal), None)
+            if hit is None:
+                missing.append(literal)
+            else:
+                built[literal] = hit
+        # A kanji listed at several JLPT levels yields one row per level, and
+        # the last one wins
+        rows: dict[str, tuple[Kanji, int | None]] = {}
+        # The outer join leaves the level NULL for kanji outside the lists
+        jlpt_level: int | None
+        if missing:
+            for row, jlpt_level in self.session.execute(
+                select(Kanji, JlptKanji.level)
+                .outerjoin(JlptKanji, JlptKanji.kanji == Kanji.literal)
+                .where(Kanji.literal.in_(missing))
+                .options(*_KANJI_LOAD)
+            ):
+                rows[row.literal] = (row, jlpt_level)
+        if rows:
+            radicals = self._radicals(list(rows))
+            for literal, (row, jlpt_level) in rows.items():
+                kanji = dtos.KanjiDTO.model_validate(
+                    _kanji_payload(row, radicals.get(literal, []), jlpt_level)
                 )
-        return result
+                built[literal] = kanji
+                self._cache.put((bind, literal), kanji)
+        return [
+            built[literal].model_copy(deep=True)
+            for literal in ordered
+            if literal in built
+        ]
 
     def stroke_svg(self, literal: str, *, raw: bool = False) -> str | None:
         """
@@ -832,7 +1172,7 @@ class KanjiRepo(KotobaseRepo):
             )
             .limit(limit)
         ).all()
-        return self.bulk_fetch(list(literals))
+        return self.bulk_fetch(literals)
 
     def search(
         self,
@@ -891,7 +1231,7 @@ class KanjiRepo(KotobaseRepo):
             Kanji.freq.is_(None), Kanji.freq, Kanji.literal
         ).limit(limit)
         literals = self.session.scalars(statement).all()
-        return self.bulk_fetch(list(literals))
+        return self.bulk_fetch(literals)
 
 
 # --- Radicals ---
@@ -1036,30 +1376,46 @@ class SentenceRepo(KotobaseRepo):
         Selects up to `limit` [`Sentence`][kotobase.db.models.Sentence] rows
         where `lang` is `jpn` and `text` matches a SQL `LIKE` pattern, ordered
         by ascending id. By default the query is wrapped as `%query%` substring
-        containment. When `wildcard` is True, `*` is translated to `%` and the
-        query is used as the `LIKE` pattern directly. For the matched sentences
-        it then resolves translations by joining
-        [`SentenceLink`][kotobase.db.models.SentenceLink] (whose `source_id` is
-        the Japanese sentence) to the target `Sentence.text`, grouping the
-        translation texts per source id. Each sentence is validated into a
-        [`SentenceDTO`][kotobase.db.dtos.SentenceDTO] with its translations
-        injected through the validation `context`
+        containment, with any `%` or `_` in it escaped through `_like_literal`
+        so they match literally. When `wildcard` is True, the query is
+        translated through `_normalise_wildcard` and used as the pattern
+        itself, so either way the database evaluates one `LIKE` predicate and
+        stops at `limit` rows. For the matched sentences it then resolves
+        translations by joining
+        [`SentenceLink`][kotobase.db.models.SentenceLink] (whose `source_id`
+        is the Japanese sentence) to the target `Sentence.text`,
+        grouping the translation texts per source id. Each sentence is
+        validated into a [`SentenceDTO`][kotobase.db.dtos.SentenceDTO] with
+        its translations injected through the validation `context`
 
         Args:
-            query (str): The text to search for, where `*` and `%` act as
-                wildcards when `wildcard` is True
+            query (str): The text to search for, where `*` and `%` match any
+                run of characters and `_` one character when `wildcard` is
+                True
             limit (int | None): Maximum number of sentences to return
             wildcard (bool): When True, treat the query as a `LIKE` pattern,
                 otherwise match it as a `%query%` substring
 
         Returns:
             The matching sentences as DTOs with their aligned translations, or
-                `[]` when none match
+                `[]` when none match or a wildcard query holds no literal
+                character
         """
-        pattern = query.replace("*", "%") if wildcard else f"%{query}%"
+        escape: str | None = None
+        if wildcard:
+            normalised = _normalise_wildcard(query)
+            if normalised is None:
+                return []
+            pattern = normalised
+        else:
+            literal, escape = _like_literal(query)
+            pattern = f"%{literal}%"
         sentences = self.session.scalars(
             select(Sentence)
-            .where(Sentence.lang == "jpn", Sentence.text.like(pattern))
+            .where(
+                Sentence.lang == "jpn",
+                Sentence.text.like(pattern, escape=escape),
+            )
             .order_by(Sentence.id)
             .limit(limit)
         ).all()
@@ -1096,9 +1452,8 @@ class JLPTRepo(KotobaseRepo):
         """
         Find the JLPT vocabulary entry for a word or reading
 
-        Selects the first [`JlptVocab`][kotobase.db.models.JlptVocab] row whose
-        `word` or `reading` equals `word` exactly (`LIMIT 1`), and validates it
-        into a [`JLPTVocabDTO`][kotobase.db.dtos.JLPTVocabDTO]
+        Thin wrapper that delegates to `vocab_by_words` with a single word and
+        unwraps the result
 
         Args:
             word (str): The headword or reading to look up
@@ -1107,18 +1462,73 @@ class JLPTRepo(KotobaseRepo):
             The vocabulary entry as a DTO, or `None` when the word is not
                 listed
         """
-        row = self.session.scalars(
-            select(JlptVocab)
-            .where((JlptVocab.word == word) | (JlptVocab.reading == word))
-            .limit(1)
-        ).first()
-        return dtos.JLPTVocabDTO.model_validate(row) if row else None
+        return self.vocab_by_words([word]).get(word)
+
+    def vocab_by_words(
+        self,
+        words: Iterable[str],
+    ) -> dict[str, dtos.JLPTVocabDTO]:
+        """
+        Find the JLPT vocabulary entries for several words or readings at once
+
+        De-duplicates `words` while keeping order and answers each one from
+        the shared `_LOOKUP_CACHE` when it can. The remaining words are looked
+        up in one query, selecting every
+        [`JlptVocab`][kotobase.db.models.JlptVocab] row whose `word` or
+        `reading` is `IN` that set ordered by ascending id, so a word listed
+        more than once resolves to its first row. Each looked up word, found
+        or not, is then stored in the cache, and callers receive copies of the
+        cached DTOs so editing a result cannot change later lookups
+
+        Args:
+            words (Iterable[str]): The headwords or readings to look up
+
+        Returns:
+            A mapping of each listed word to its vocabulary entry as a
+                [`JLPTVocabDTO`][kotobase.db.dtos.JLPTVocabDTO] in input order,
+                omitting words that are not listed
+        """
+        bind = _engine_key(self.session)
+        resolved: dict[str, dtos.JLPTVocabDTO | None] = {}
+        missing: list[str] = []
+        for word in dict.fromkeys(words):
+            hit = _LOOKUP_CACHE.get((_VOCAB_KEY, bind, word), _MISSING)
+            if hit is _MISSING:
+                missing.append(word)
+                resolved[word] = None
+            else:
+                resolved[word] = cast("dtos.JLPTVocabDTO | None", hit)
+        if missing:
+            rows = self.session.scalars(
+                select(JlptVocab)
+                .where(
+                    JlptVocab.word.in_(missing)
+                    | JlptVocab.reading.in_(missing)
+                )
+                .order_by(JlptVocab.id)
+            )
+            wanted = set(missing)
+            fetched: dict[str, dtos.JLPTVocabDTO] = {}
+            for row in rows:
+                for key in (row.word, row.reading):
+                    if key is None or key not in wanted or key in fetched:
+                        continue
+                    fetched[key] = dtos.JLPTVocabDTO.model_validate(row)
+            for word in missing:
+                resolved[word] = fetched.get(word)
+                _LOOKUP_CACHE.put((_VOCAB_KEY, bind, word), resolved[word])
+        return {
+            word: vocab.model_copy(deep=True)
+            for word, vocab in resolved.items()
+            if vocab is not None
+        }
 
     def kanji_levels(self, literals: Sequence[str]) -> dict[str, int]:
         """
         Map each given kanji to its Tanos JLPT level
 
-        De-duplicates `literals`, then selects `(kanji, level)` from
+        De-duplicates `literals`, then runs the prebuilt `_KANJI_LEVELS`
+        statement, selecting `(kanji, level)` from
         [`JlptKanji`][kotobase.db.models.JlptKanji] where `kanji` is `IN` that
         set. An empty input returns `{}` without a query
 
@@ -1132,12 +1542,8 @@ class JLPTRepo(KotobaseRepo):
         wanted = list(dict.fromkeys(literals))
         if not wanted:
             return {}
-        rows = self.session.execute(
-            select(JlptKanji.kanji, JlptKanji.level).where(
-                JlptKanji.kanji.in_(wanted)
-            )
-        )
-        return {row.kanji: row.level for row in rows}
+        rows = self.session.execute(_KANJI_LEVELS, {"literals": wanted})
+        return dict(rows.all())
 
     def grammar_like(
         self,
@@ -1150,8 +1556,9 @@ class JLPTRepo(KotobaseRepo):
 
         Selects up to `limit` [`JlptGrammar`][kotobase.db.models.JlptGrammar]
         rows whose `grammar` contains `query` as a substring
-        (`LIKE '%query%'`), ordered by descending `level` (so N1 grammar comes
-        before N5), and validates each into a
+        (`LIKE '%query%'`, escaped through `_like_literal`), ordered by
+        descending `level` (so N1 grammar comes before N5), and validates each
+        into a
         [`JLPTGrammarDTO`][kotobase.db.dtos.JLPTGrammarDTO]
 
         Args:
@@ -1162,9 +1569,10 @@ class JLPTRepo(KotobaseRepo):
             The matching grammar points as DTOs ordered by descending level, or
                 `[]` when none match
         """
+        literal, escape = _like_literal(query)
         rows = self.session.scalars(
             select(JlptGrammar)
-            .where(JlptGrammar.grammar.like(f"%{query}%"))
+            .where(JlptGrammar.grammar.like(f"%{literal}%", escape=escape))
             .order_by(JlptGrammar.level.desc())
             .limit(limit)
         ).all()
@@ -1268,7 +1676,9 @@ class TagRepo(KotobaseRepo):
         Map tag codes to their human readable descriptions
 
         De-duplicates `codes`, then selects `(code, description)` from
-        [`Tag`][kotobase.db.models.Tag] where `code` is `IN` that set. Because
+        [`Tag`][kotobase.db.models.Tag] where `code` is `IN` that set, bound as
+        one expanding parameter so any number of codes shares a compiled
+        statement. Because
         the lookup is by `code` alone (not by category), a code shared across
         tag families collapses to a single description. An empty input returns
         `{}` without a query
@@ -1284,9 +1694,12 @@ class TagRepo(KotobaseRepo):
         if not wanted:
             return {}
         rows = self.session.execute(
-            select(Tag.code, Tag.description).where(Tag.code.in_(wanted))
+            select(Tag.code, Tag.description).where(
+                Tag.code.in_(bindparam("codes", expanding=True))
+            ),
+            {"codes": wanted},
         )
-        return {row.code: row.description for row in rows}
+        return dict(rows.all())
 
 
 class AudioRepo(KotobaseRepo):
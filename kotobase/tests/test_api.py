@@ -9,6 +9,7 @@ from __future__ import annotations
 import pytest
 
 from kotobase import APIError, AudioDatabaseNotFoundError, Kotobase
+from kotobase.db.uow import UnitOfWork
 
 
 def test_lookup_aggregates_sources(kb: Kotobase) -> None:
@@ -22,6 +23,15 @@ def test_lookup_aggregates_sources(kb: Kotobase) -> None:
     assert any(k.literal == "語" for k in result.kanji)
 
 
+def test_mutating_a_result_does_not_reach_the_cache(kb: Kotobase) -> None:
+    """
+    Cached entries are handed out as copies, so editing one result leaves
+    later lookups intact
+    """
+    kb.lookup("日本語").entries[0].senses.clear()
+    assert kb.lookup("日本語").entries[0].senses
+
+
 def test_kanji_orm_mapping_derives_fields(kb: Kotobase) -> None:
     """
     KanjiDTO is assembled from several relationships and injected data
@@ -165,3 +175,25 @@ def test_methods_accept_dtos(kb: Kotobase) -> None:
     assert kb.jlpt_level(vocab) == 5
     assert kb.kanji(kanji) is not None
     assert kb.sentences(entry)
+
+
+def test_sentences_match_like_metacharacters_literally(kb: Kotobase) -> None:
+    """
+    `%` and `_` in a plain sentence query match only themselves
+    """
+    assert kb.sentences("日本語")
+    assert kb.sentences("_") == []
+    assert kb.sentences("%") == []
+
+
+def test_wildcard_sentence_search_keeps_like_semantics(kb: Kotobase) -> None:
+    """
+    Wildcard sentence searches keep full `LIKE` semantics
+    """
+    with UnitOfWork() as uow:
+        search = uow.sentences.search_containing
+        assert search("日本*する_", wildcard=True)
+        assert search("*勉強*", wildcard=True)
+        assert search("日本*", wildcard=True, limit=1)
+        assert search("勉強*", wildcard=True) == []
+        assert search("日本*する", wildcard=True) == []
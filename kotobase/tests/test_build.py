@@ -0,0 +1,259 @@
+"""
+Tests for the builder's staged load and merge
+
+These build small databases from the bundled JLPT lists and tiny hand-written
+source files, so they run without downloading anything
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import sqlite3
+import tarfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kotobase.db.builder import extractors
+from kotobase.db.builder.build import Builder, Loader, _load
+
+_JMDICT = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE JMdict [
+<!ENTITY n "noun (common) (futsuumeishi)">
+<!ENTITY sl "slang">
+]>
+<JMdict>
+<entry>
+<ent_seq>1</ent_seq>
+<k_ele><keb>日本語</keb></k_ele>
+<r_ele><reb>にほんご</reb></r_ele>
+<sense><pos>&n;</pos><gloss>Japanese</gloss></sense>
+<sense><misc>&sl;</misc><gloss>Japanese (slang)</gloss></sense>
+</entry>
+<entry>
+<ent_seq>2</ent_seq>
+<r_ele><reb>ご</reb></r_ele>
+<sense><pos>&n;</pos><gloss>word</gloss></sense>
+</entry>
+</JMdict>
+"""
+
+_JMNEDICT = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE JMnedict [
+<!ENTITY surname "family or surname">
+]>
+<JMnedict>
+<entry>
+<ent_seq>5000000</ent_seq>
+<k_ele><keb>田中</keb></k_ele>
+<r_ele><reb>たなか</reb></r_ele>
+<trans><name_type>&surname;</name_type><trans_det>Tanaka</trans_det></trans>
+</entry>
+</JMnedict>
+"""
+
+_FURIGANA = [
+    {
+        "text": "日本語",
+        "reading": "にほんご",
+        "furigana": [{"ruby": "日本", "rt": "にほん"}, {"ruby": "語"}],
+    },
+    {
+        "text": "語",
+        "reading": "ご",
+        "furigana": [{"ruby": "語", "rt": "ご"}],
+    },
+]
+
+
+def _furigana_archive(path: Path, *, bom: bool = False) -> Path:
+    """
+    Write `_FURIGANA` as the `JSON` member of a gzipped tar archive
+
+    Args:
+        path (Path): The archive to write
+        bom (bool): When True, prefix the document with a `UTF-8` byte order
+            mark
+
+    Returns:
+        The archive path
+    """
+    data = json.dumps(_FURIGANA, ensure_ascii=False).encode("utf-8")
+    if bom:
+        data = b"\xef\xbb\xbf" + data
+    with tarfile.open(path, "w:gz") as archive:
+        member = tarfile.TarInfo("JmdictFurigana.json")
+        member.size = len(data)
+        archive.addfile(member, io.BytesIO(data))
+    return path
+
+
+def _sources(root: Path) -> list[tuple[str, tuple[Any, ...]]]:
+    """
+    Write the tiny source files and return a build plan over them
+
+    Args:
+        root (Path): Directory to write the sources into
+
+    Returns:
+        Extractor names paired with their arguments, in build order
+    """
+    jmdict = root / "JMdict_e.gz"
+    jmdict.write_bytes(gzip.compress(_JMDICT.encode("utf-8")))
+    jmnedict = root / "JMnedict.xml.gz"
+    jmnedict.write_bytes(gzip.compress(_JMNEDICT.encode("utf-8")))
+    furigana = _furigana_archive(root / "JmdictFurigana.json.tar.gz")
+    return [
+        ("jmdict", (jmdict,)),
+        ("jmnedict", (jmnedict,)),
+        ("furigana", (furigana,)),
+        ("jlpt", ()),
+    ]
+
+
+def _dump(path: Path, tables: set[str]) -> dict[str, list[tuple[Any, ...]]]:
+    """
+    Read every row of the given tables, ordered by their first column
+
+    Args:
+        path (Path): The database to read
+        tables (set[str]): The tables to dump
+
+    Returns:
+        Mapping of each table name to its rows
+    """
+    conn = sqlite3.connect(path)
+    try:
+        return {
+            table: conn.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall()
+            for table in sorted(tables)
+        }
+    finally:
+        conn.close()
+
+
+def test_staged_load_matches_sequential_load(tmp_path: Path) -> None:
+    """
+    Loading through worker stages and merging them gives the same tables as
+    streaming every extractor in process, and leaves no staging files behind
+    """
+    plan = _sources(tmp_path)
+    tables = {
+        table
+        for name, _ in plan
+        for table in extractors.EXTRACTORS[name].tables
+    }
+    dumps = []
+    counts = []
+    for workers in (1, 2):
+        target = tmp_path / f"workers-{workers}" / "kotobase.db"
+        target.parent.mkdir()
+        with Builder(target) as builder:
+            builder.create_schema(only=tables)
+            _load(builder, plan, workers=workers)
+            counts.append(builder.loader.counts)
+        dumps.append(_dump(target, tables))
+        assert list(target.parent.glob("stage-*")) == []
+    assert dumps[0] == dumps[1]
+    assert counts[0] == counts[1]
+    assert dumps[0]["jlpt_vocab"]
+    assert len(dumps[0]["furigana"]) == len(_FURIGANA)
+    assert {(code, category) for code, category, _ in dumps[0]["tag"]} == {
+        ("n", "pos"),
+        ("sl", "misc"),
+        ("surname", "name_type"),
+    }
+
+
+def test_merge_into_existing_database_releases_its_lock(
+    tmp_path: Path,
+) -> None:
+    """
+    Merging a stage into an existing database keeps the first `OR IGNORE`
+    row, honours `locking_mode=EXCLUSIVE` while the builder is open, and
+    leaves the file usable by a plain connection once it is closed
+    """
+    target = tmp_path / "kotobase.db"
+    with Builder(target) as builder:
+        builder.create_schema(only={"tag"})
+        builder.loader.add(
+            "tag", {"code": "n", "category": "pos", "description": "first"}
+        )
+        builder.finish_load()
+
+    stage = tmp_path / "stage.db"
+    with Builder(stage) as staging:
+        staging.create_schema(only={"tag"})
+        # A batch smaller than the row count flushes mid-stream as well as
+        # at the end
+        staging.loader = Loader(staging.conn, batch=2)
+        for code, description in (
+            ("n", "second"),
+            ("v", "verb"),
+            ("adj", "adjective"),
+        ):
+            staging.loader.add(
+                "tag",
+                {"code": code, "category": "pos", "description": description},
+            )
+        staging.finish_load()
+        stage_counts = staging.loader.counts
+    assert stage_counts == {"tag": 3}
+
+    with Builder(target) as builder:
+        builder.merge(stage, stage_counts)
+        assert builder.loader.counts == {"tag": 3}
+        attached = [
+            row[1] for row in builder.conn.execute("PRAGMA database_list")
+        ]
+        assert "stage" not in attached
+        other = sqlite3.connect(target, timeout=0)
+        try:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("SELECT count(*) FROM tag")
+        finally:
+            other.close()
+
+    conn = sqlite3.connect(target, timeout=0)
+    try:
+        rows = dict(
+            conn.execute("SELECT code, description FROM tag").fetchall()
+        )
+        conn.execute(
+            "INSERT INTO tag VALUES ('x', 'misc', 'written after the build')"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    assert rows == {"n": "first", "v": "verb", "adj": "adjective"}
+
+
+def test_furigana_json_may_start_with_a_bom(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    A `JmdictFurigana.json` starting with a byte order mark still decodes
+    when the whole document is loaded at once
+    """
+    monkeypatch.setattr(extractors, "ijson", None)
+    archive = _furigana_archive(tmp_path / "furigana.tar.gz", bom=True)
+    rows = list(extractors.extract_furigana(archive))
+    assert [row["text"] for _, row in rows] == ["日本語", "語"]
+
+
+@pytest.mark.parametrize("bom", [False, True])
+def test_furigana_streams_through_ijson(tmp_path: Path, bom: bool) -> None:
+    """
+    With `ijson` installed the furigana array is parsed incrementally, with
+    or without a leading byte order mark
+    """
+    pytest.importorskip("ijson")
+    assert extractors.ijson is not None
+    archive = _furigana_archive(tmp_path / "furigana.tar.gz", bom=bom)
+    rows = list(extractors.extract_furigana(archive))
+    assert [row["text"] for _, row in rows] == ["日本語", "語"]
+    assert json.loads(rows[0][1]["segments"]) == _FURIGANA[0]["furigana"]
@@ -0,0 +1,79 @@
+"""
+Tests for the bounded LFU cache backing the repository lookups
+"""
+
+from __future__ import annotations
+
+from kotobase.db.cache import LFUCache
+
+
+def test_lfu_cache_evicts_least_frequently_used() -> None:
+    """
+    A full cache drops the least used key, the oldest one on a tie
+    """
+    cache: LFUCache[str, int] = LFUCache(maxsize=2)
+    cache.put("hot", 1)
+    cache.put("cold", 2)
+    assert cache.get("hot", None) == 1
+    cache.put("new", 3)
+    assert "cold" not in cache
+    assert "hot" in cache
+    cache.put("newer", 4)
+    assert "new" not in cache
+    assert len(cache) == 2
+
+
+def test_lfu_cache_keeps_none_and_clears() -> None:
+    """
+    A cached None is told apart from a miss, and clear empties the cache
+    """
+    cache: LFUCache[str, int | None] = LFUCache(maxsize=4)
+    missing = object()
+    cache.put("absent", None)
+    assert cache.get("absent", missing) is None
+    cache.clear()
+    assert cache.get("absent", missing) is missing
+    assert len(cache) == 0
+
+
+def test_lfu_cache_weighs_entries_with_getsizeof() -> None:
+    """
+    Weighted entries are evicted until the total fits, oversized ones skipped
+    """
+    cache: LFUCache[str, tuple[int, ...]] = LFUCache(maxsize=5, getsizeof=len)
+    cache.put("a", (1, 2))
+    cache.put("b", (1, 2))
+    assert cache.get("b", None) == (1, 2)
+    cache.put("c", (1, 2, 3))
+    assert "a" not in cache
+    assert cache.currsize == 5
+    cache.put("huge", (1,) * 6)
+    assert "huge" not in cache
+    assert cache.currsize == 5
+    cache.put("c", (1,) * 6)
+    assert "c" not in cache
+    assert cache.get("c", None) is None
+    assert cache.currsize == 2
+
+
+def test_lfu_cache_evicts_across_buckets_in_one_put() -> None:
+    """
+    A heavy insert evicts the least used keys from several count buckets in
+    turn, keeping the most used one
+    """
+    cache: LFUCache[str, tuple[int, ...]] = LFUCache(maxsize=4, getsizeof=len)
+    for uses, key in enumerate(("once", "twice", "thrice", "often")):
+        cache.put(key, (uses,))
+        for _ in range(uses):
+            cache.get(key, None)
+    cache.put("heavy", (1, 2, 3))
+    assert [key in cache for key in ("once", "twice", "thrice")] == [
+        False,
+        False,
+        False,
+    ]
+    assert "often" in cache
+    assert cache.currsize == 4
+    cache.put("next", (1,))
+    assert "heavy" not in cache
+    assert "often" in cache
@@ -41,6 +41,27 @@ def test_db_pull_pulls_audio_instead_of_building(
     assert "build_audio" not in calls
 
 
+def test_db_build_forwards_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    `db build --workers` reaches the core build and rejects values below 1
+    """
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        cli.builder, "build_core", lambda **kw: calls.append(kw)
+    )
+    result = runner.invoke(
+        cli.app, ["db", "build", "--no-audio", "--workers", "2"]
+    )
+    assert result.exit_code == 0
+    assert calls[0]["workers"] == 2
+    result = runner.invoke(
+        cli.app, ["db", "build", "--no-audio", "--workers", "0"]
+    )
+    assert result.exit_code != 0
+
+
 def test_lookup_json_keeps_japanese_verbatim(kb: object) -> None:
     """
     The --json output is valid and keeps Japanese text unescaped
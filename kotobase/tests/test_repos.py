@@ -0,0 +1,130 @@
+"""
+Database-backed tests for repository query shapes
+
+These run against the tiny fixture database from conftest
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+from kotobase import Kotobase
+from kotobase.db import repos
+from kotobase.db.uow import UnitOfWork
+
+
+def test_strict_search_form_issues_one_query_per_load_path(
+    kb: Kotobase,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Under strict loading a form search runs the entry select plus one select
+    per eager-loaded relationship path, with no lazy loads
+    """
+    monkeypatch.setenv(repos.ENV_STRICT_LOAD, "1")
+    repos._SEARCH_CACHE.clear()
+    statements: list[str] = []
+
+    def count(*args: Any) -> None:
+        statements.append(args[2])
+
+    with UnitOfWork() as uow:
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            entries = uow.jmdict.search_form("日本語")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    assert entries[0].senses[0].glosses
+    # entry, kanji, kana, senses, senses.glosses
+    assert len(statements) == 5
+
+
+def test_vocab_by_words_matches_single_lookups(kb: Kotobase) -> None:
+    """
+    The bulk vocabulary lookup resolves words and readings in one call, drops
+    unlisted words, and agrees with the single-word wrapper
+    """
+    with UnitOfWork() as uow:
+        found = uow.jlpt.vocab_by_words(
+            w for w in ("にほんご", "無い", "日本語")
+        )
+        assert list(found) == ["にほんご", "日本語"]
+        assert found["日本語"].level == 5
+        assert uow.jlpt.vocab_by_word("日本語") == found["日本語"]
+        assert uow.jlpt.vocab_by_word("無い") is None
+        found["日本語"].level = 1
+        again = uow.jlpt.vocab_by_word("日本語")
+        assert again is not None
+        assert again.level == 5
+
+
+def test_browse_by_type_matches_whole_codes(kb: Kotobase) -> None:
+    """
+    Browsing by name type finds the tagged names and treats `_` literally
+    """
+    with UnitOfWork() as uow:
+        names = uow.jmnedict.browse_by_type("surname")
+        assert [name.id for name in names]
+        assert uow.jmnedict.browse_by_type("sur_ame") == []
+        assert uow.jmnedict.browse_by_type("place") == []
+
+
+def test_bulk_fetch_accepts_a_generator(kb: Kotobase) -> None:
+    """
+    bulk_fetch reads its input once, so a generator keeps order and dedupes
+    """
+    with UnitOfWork() as uow:
+        kanji = uow.kanji.bulk_fetch(c for c in "語無語")
+        assert [k.literal for k in kanji] == ["語"]
+        assert kanji[0].jlpt_tanos == 5
+
+
+def test_kanji_cache_serves_repeat_fetches(kb: Kotobase) -> None:
+    """
+    A repeated kanji fetch is answered from the cache without a query, and
+    clear forces the next fetch back to the database
+    """
+    repos.KanjiRepo.clear()
+    statements: list[str] = []
+
+    def count(*args: Any) -> None:
+        statements.append(args[2])
+
+    with UnitOfWork() as uow:
+        first = uow.kanji.by_literal("語")
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            assert uow.kanji.by_literal("語") == first
+            assert statements == []
+            repos.KanjiRepo.clear()
+            assert uow.kanji.by_literal("語") == first
+            assert statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+
+def test_cached_kanji_survive_caller_mutation(kb: Kotobase) -> None:
+    """
+    Editing a returned kanji leaves the cached profile untouched
+    """
+    kb.lookup("日本語").kanji[0].meanings.append("HACKED")
+    assert "HACKED" not in kb.lookup("日本語").kanji[0].meanings
+    kanji = kb.kanji("語")
+    assert kanji is not None
+    assert "HACKED" not in kanji.meanings
+
+
+def test_wildcard_only_queries_return_nothing(kb: Kotobase) -> None:
+    """
+    Wildcard searches with no literal character are rejected without a scan
+    """
+    with UnitOfWork() as uow:
+        assert uow.jmdict.search_form("*", wildcard=True) == []
+        assert uow.jmnedict.search("%_", wildcard=True) == []
+        assert uow.sentences.search_containing("**", wildcard=True) == []
+        assert uow.jmdict.search_form("日本*", wildcard=True)